@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+Server = __import__('1-simple_pagination').Server
+Server.DATA_FILE = "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"
+
+# Many threads asking at once share a single load
+server = Server(warm=True)
+pages = []
+threads = [threading.Thread(target=lambda: pages.append(server.get_page(3, 2)))
+           for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(server.wait_ready(5), server.ready())
+print(len(pages), all(page == pages[0] for page in pages), pages[0])
+
+for mode in ({'mmap_rows': True}, {'columnar': True}):
+    print(mode, Server(**mode).get_page(3, 2) == pages[0])
+
+# A background load that fails wakes the waiters with its error
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "names.csv")
+
+
+class LateServer(Server):
+    DATA_FILE = path
+
+
+server = LateServer(warm=True)
+try:
+    server.wait_ready(5)
+except OSError as error:
+    print(type(error).__name__, server.ready())
+
+# The next call tries again
+with open(path, "w") as file:
+    file.write("id,name\n1,Ada\n2,Alan\n")
+print(server.get_page(1, 10), server.wait_ready(0), server.ready())
+shutil.rmtree(directory)
+
+# Waiting on a server that was not warmed loads it instead of hanging
+server = Server()
+print(server.ready(), server.wait_ready(), server.ready())
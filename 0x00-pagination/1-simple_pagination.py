@@ -3,7 +3,11 @@
     Includes a function to get index ranges for paginated data.
 """
 import csv
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+from columnar import ColumnarDataset
+from lazy_loader import LazyLoader
+from row_index import RowIndex
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -29,9 +33,27 @@ class Server:
     """
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
-        """Initializes a new Server instance, with dataset caching."""
-        self.__dataset = None
+    def __init__(self, mmap_rows: bool = False, columnar: bool = False,
+                 warm: bool = False):
+        """Initializes a new Server instance, with dataset caching.
+
+        Loading is lazy and single-flight: when several threads ask for
+        the dataset at once, one parses the CSV and the others wait for it.
+
+        Args:
+            mmap_rows (bool): Serve pages from a memory-mapped row offset
+                index instead of parsing the whole CSV up front.
+            columnar (bool): Keep the dataset dictionary-encoded in typed
+                column arrays and materialize rows only when paged.
+            warm (bool): Start loading on a background thread right away;
+                see ready() and wait_ready().
+        """
+        self.__dataset = LazyLoader(self.__parse)
+        self.__mmap_rows = mmap_rows
+        self.__columnar = columnar
+        self.__rows = LazyLoader(self.__load_rows)
+        if warm:
+            self.__rows.start()
 
     def dataset(self) -> List[List]:
         """Returns the cached dataset, loading it from the CSV file if necessary.
@@ -39,13 +61,49 @@ class Server:
         Returns:
             List[List]: A list of lists representing the dataset.
         """
-        if self.__dataset is None:
-            with open(self.DATA_FILE) as file:
-                reader = csv.reader(file)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]  # Skip the header row
+        return self.__dataset.get()
 
-        return self.__dataset
+    def __parse(self) -> List[List]:
+        """Parses every row of DATA_FILE except the header."""
+        with open(self.DATA_FILE) as file:
+            reader = csv.reader(file)
+            dataset = [row for row in reader]
+        return dataset[1:]  # Skip the header row
+
+    def rows(self) -> Sequence[List]:
+        """Returns the row storage pages are sliced from.
+
+        Returns:
+            Sequence[List]: The mmap-backed row index in mmap mode, the
+                columnar dataset in columnar mode, otherwise the parsed
+                dataset.
+        """
+        return self.__rows.get()
+
+    def __load_rows(self) -> Sequence[List]:
+        """Loads the row storage for the configured mode."""
+        if self.__columnar:
+            return ColumnarDataset.from_csv(self.DATA_FILE)
+        if self.__mmap_rows:
+            return RowIndex(self.DATA_FILE)
+        return self.dataset()
+
+    def ready(self) -> bool:
+        """Tells whether the rows are loaded and pages can be served."""
+        return self.__rows.ready()
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        """Blocks until the rows are loaded or timeout seconds pass.
+
+        Loading starts now if warm was off and nothing has loaded yet.
+
+        Returns:
+            bool: True if the rows are loaded.
+
+        Raises:
+            Exception: What loading raised, if it failed.
+        """
+        return self.__rows.wait(timeout)
 
     def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
         """Retrieves a page of the dataset based on page number and page size.
@@ -63,7 +121,7 @@ class Server:
             "Page and page_size must be positive integers."
 
         start_index, end_index = index_range(page, page_size)
-        data = self.dataset()
+        data = self.rows()
         
         if start_index >= len(data):
             return []
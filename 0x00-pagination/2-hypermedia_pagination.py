@@ -5,7 +5,22 @@
 """
 import csv
 import math
-from typing import Dict, List, Tuple
+import mmap
+import os
+import threading
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from columnar import ColumnarDataset
+from dataset_view import (UNKNOWN_MARK, DatasetView, mark_buffer,
+                          read_complete)
+from lazy_loader import LazyLoader
+from page_view import PageView
+from parallel_loader import last_row_end, load_end, load_rows
+from response_cache import LRUCache, ResponseCache
+from row_index import RowIndex
+from shared_dataset import SharedDataset
+from snapshot import load_dataset
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -28,12 +43,56 @@ class Server:
     
     Attributes:
         DATA_FILE (str): Path to the CSV file containing the dataset.
+        SEARCH_COLUMN (str): The column search() matches prefixes against.
     """
     DATA_FILE = "Popular_Baby_Names.csv"
+    SEARCH_COLUMN = "Child's First Name"
+
+    def __init__(self, mmap_rows: bool = False, columnar: bool = False,
+                 snapshot: bool = False, shared_name: str = None,
+                 parallel: bool = False, cache_size: int = 0,
+                 cache_policy: type = None, warm: bool = False):
+        """Initializes a new Server instance with dataset caching.
 
-    def __init__(self):
-        """Initializes a new Server instance with dataset caching."""
-        self.__dataset = None
+        Loading is lazy and single-flight: when several threads ask for
+        the dataset at once, one loads it and the others wait for it.
+
+        Args:
+            mmap_rows (bool): Serve pages from a memory-mapped row offset
+                index instead of parsing the whole CSV up front.
+            columnar (bool): Keep the dataset dictionary-encoded in typed
+                column arrays and materialize rows only when paged.
+            snapshot (bool): Like columnar, but load the columns from a
+                binary snapshot next to DATA_FILE, rebuilding it when the
+                CSV changes.
+            shared_name (str): Like columnar, but attach read-only to a
+                dataset another process published with
+                SharedDataset.publish() under this name.
+            parallel (bool): Parse large CSV files for dataset() across
+                a process pool instead of on a single core.
+            cache_size (int): Memoize up to this many get_hyper()
+                responses; 0 disables the cache.
+            cache_policy (type): The 0x01-caching policy evicting cached
+                responses, LRUCache by default.
+            warm (bool): Start loading on a background thread right away;
+                see ready() and wait_ready().
+        """
+        self.__dataset = LazyLoader(self.__parse)
+        self.__parallel = parallel
+        self.__mmap_rows = mmap_rows
+        self.__columnar = columnar or snapshot or shared_name is not None
+        self.__snapshot = snapshot
+        self.__shared_name = shared_name
+        self.__shared = None
+        self.__view = LazyLoader(self.__load_view)
+        self.__refresh_lock = threading.Lock()
+        self.__watching = None
+        self.__responses = None
+        if cache_size > 0:
+            self.__responses = ResponseCache(cache_size,
+                                             cache_policy or LRUCache)
+        if warm:
+            self.__view.start()
 
     def dataset(self) -> List[List]:
         """Loads and caches the dataset if not already cached.
@@ -41,20 +100,183 @@ class Server:
         Returns:
             List[List]: A list of lists representing the dataset.
         """
-        if self.__dataset is None:
-            with open(self.DATA_FILE) as file:
-                reader = csv.reader(file)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]  # Skip header
+        if not self.__mmap_rows and not self.__columnar:
+            return self.view().rows
+        return self.__dataset.get()
+
+    def __parse(self) -> List[List]:
+        """Parses every row of DATA_FILE except the header."""
+        with open(self.DATA_FILE) as file:
+            reader = csv.reader(file)
+            dataset = [row for row in reader]
+        return dataset[1:]  # Skip header
+
+    def view(self) -> DatasetView:
+        """Returns the current rows and indexes, loading them if necessary.
+
+        Callers that need several reads to agree should grab the view
+        once, since refresh() may replace it at any time.
+
+        Returns:
+            DatasetView: The current view.
+        """
+        return self.__view.get()
+
+    def ready(self) -> bool:
+        """Tells whether the dataset is loaded and pages can be served."""
+        return self.__view.ready()
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        """Blocks until the dataset is loaded or timeout seconds pass.
+
+        Loading starts now if warm was off and nothing has loaded yet.
+
+        Returns:
+            bool: True if the dataset is loaded.
+
+        Raises:
+            Exception: What loading raised, if it failed.
+        """
+        return self.__view.wait(timeout)
+
+    def rows(self) -> Sequence[List]:
+        """Returns the row storage pages are sliced from.
+
+        Returns:
+            Sequence[List]: The mmap-backed row index in mmap mode, the
+                columnar dataset in columnar mode, otherwise the parsed
+                dataset.
+        """
+        return self.view().rows
+
+    def __load_view(self, generation: int = 0) -> DatasetView:
+        """Loads the rows from shared memory, snapshot, mmap or CSV.
+
+        The view is marked with where its rows end in DATA_FILE, taken
+        from the very bytes the rows were parsed from, or UNKNOWN_MARK
+        if the file changed while it was read, so the next refresh()
+        reloads it in full rather than appending to it.
+        """
+        path = self.DATA_FILE
+        header, mark = None, None
+        before = os.stat(path)
+        if self.__shared_name is not None:
+            self.__shared = SharedDataset.attach(self.__shared_name)
+            rows = self.__shared.dataset
+        elif self.__snapshot:
+            rows = load_dataset(path)
+        elif self.__columnar:
+            reader, mark = read_complete(path)
+            rows = ColumnarDataset.from_rows(next(reader, []), reader)
+        elif self.__mmap_rows:
+            rows = RowIndex(path)
+            mark = mark_buffer(rows.buffer, rows.end, rows.identity,
+                               rows.stop - rows.end)
+        elif self.__parallel:
+            with open(path, 'rb') as file, mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                stat = os.fstat(file.fileno())
+                end = last_row_end(buf)
+                stop = load_end(buf, end)
+                mark = mark_buffer(buf, end, (stat.st_dev, stat.st_ino),
+                                   stop - end)
+            rows = load_rows(path, end=stop)
+        else:
+            reader, mark = read_complete(path)
+            header = next(reader, [])
+            rows = list(reader)
+
+        if isinstance(rows, ColumnarDataset):
+            header = rows.header
+        elif header is None:
+            with open(path, newline='') as file:
+                header = next(csv.reader(file), [])
+        view = DatasetView(rows, header, generation, mark)
+        if self.__shared_name is None and (mark is None or self.__parallel):
+            # These rows were not parsed from the marked bytes themselves,
+            # so the mark only holds if the file did not change meanwhile
+            view.marked(path)
+            after = os.stat(path)
+            if (before.st_dev, before.st_ino, before.st_size,
+                    before.st_mtime_ns) != (after.st_dev, after.st_ino,
+                                            after.st_size, after.st_mtime_ns):
+                view.mark = UNKNOWN_MARK
+        return view
+
+    def refresh(self) -> bool:
+        """Picks up changes made to DATA_FILE since it was loaded.
+
+        Rows appended to the file are parsed from where the last read
+        stopped and added to the dataset and its posting lists. If the
+        file was truncated or rewritten, or rows are served from mmap,
+        everything is reloaded. Either way the new view replaces the old
+        one in a single assignment, so calls already in flight finish on
+        the old, consistent view. A shared dataset belongs to its
+        publisher and is never refreshed.
+
+        Returns:
+            bool: True if the dataset changed.
+        """
+        if self.__shared_name is not None:
+            return False
+        with self.__refresh_lock:
+            view = self.view()
+            fresh = view.appended(self.DATA_FILE)
+            if fresh is view:
+                return False
+            if fresh is None:
+                fresh = self.__load_view(view.generation + 1)
+            self.__view.set(fresh)
+            return True
+
+    def watch(self, interval: float = 60.0) -> None:
+        """Calls refresh() every interval seconds on a daemon thread.
+
+        Args:
+            interval (float): Seconds between checks of DATA_FILE.
+        """
+        self.unwatch()
+        stop = threading.Event()
+
+        def poll():
+            while not stop.wait(interval):
+                try:
+                    self.refresh()
+                except (OSError, ValueError, csv.Error):
+                    pass  # Retry on the next tick, e.g. mid-rotation
+
+        self.__watching = stop
+        threading.Thread(target=poll, daemon=True).start()
+
+    def unwatch(self) -> None:
+        """Stops the thread started by watch(), if any."""
+        if self.__watching is not None:
+            self.__watching.set()
+            self.__watching = None
+
+    def header(self) -> List[str]:
+        """Returns the column names from the first row of the CSV file."""
+        return self.view().header
 
-        return self.__dataset
+    def select(self, filters: Dict[str, str] = None,
+               order_by: str = None) -> Optional[Sequence[int]]:
+        """Resolves filters and ordering to the ids of the rows to page.
 
-    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+        See DatasetView.select().
+        """
+        return self.view().select(filters, order_by)
+
+    def get_page(self, page: int = 1, page_size: int = 10,
+                 filters: Dict[str, str] = None,
+                 order_by: str = None) -> List[List]:
         """Retrieves a specific page of the dataset.
         
         Args:
             page (int): The page number (1-indexed).
             page_size (int): The number of items per page.
+            filters (Dict[str, str]): Only page through rows whose columns
+                equal these values, see select().
+            order_by (str): Page through rows in this order, see select().
         
         Returns:
             List[List]: A list of rows corresponding to the requested page.
@@ -64,30 +286,67 @@ class Server:
         assert page > 0 and page_size > 0, \
             "Page and page_size must be greater than zero."
 
+        data_page, _ = self.__page(self.view(), page, page_size,
+                                   filters, order_by)
+        return data_page
+
+    def __page(self, view: DatasetView, page: int, page_size: int,
+               filters: Dict[str, str] = None,
+               order_by: str = None) -> Tuple[List[List], int]:
+        """Slices one page out of view.
+
+        Returns:
+            Tuple[List[List], int]: The rows of the page, and the number
+                of rows being paged through.
+        """
         start_index, end_index = index_range(page, page_size)
-        data = self.dataset()
+        data = view.rows
+        row_ids = view.select(filters, order_by)
+
+        if row_ids is not None:
+            return [data[i] for i in row_ids[start_index:end_index]], \
+                len(row_ids)
 
-        if start_index >= len(data):
-            return []
+        if start_index >= view.length:
+            return [], view.length
 
-        return data[start_index:end_index]
+        return data[start_index:min(end_index, view.length)], view.length
 
-    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict:
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  filters: Dict[str, str] = None,
+                  order_by: str = None) -> Dict:
         """Retrieves pagination details along with the data for a specific page.
         
         Args:
             page (int): The page number (1-indexed).
             page_size (int): The number of items per page.
+            filters (Dict[str, str]): Only page through rows whose columns
+                equal these values, see select().
+            order_by (str): Page through rows in this order, see select().
         
         Returns:
             Dict: A dictionary with pagination metadata and page content.
         """
-        data_page = self.get_page(page, page_size)
+        assert isinstance(page, int) and isinstance(page_size, int), \
+            "Page and page_size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page_size must be greater than zero."
+
+        view = self.view()
+        if self.__responses is not None:
+            filter_key = tuple(sorted(
+                (k, str(v)) for k, v in (filters or {}).items()))
+            key = (page, page_size, order_by, filter_key)
+            response = self.__responses.get(key, view.generation)
+            if response is not None:
+                return response
+
+        data_page, total_data = self.__page(view, page, page_size,
+                                            filters, order_by)
         start_index, end_index = index_range(page, page_size)
-        total_data = len(self.dataset())
         total_pages = math.ceil(total_data / page_size)
 
-        return {
+        response = {
             'page_size': len(data_page),
             'page': page,
             'data': data_page,
@@ -95,4 +354,154 @@ class Server:
             'prev_page': page - 1 if start_index > 0 else None,
             'total_pages': total_pages,
         }
+        if self.__responses is not None:
+            self.__responses.put(key, view.generation, response)
+        return response
+
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Returns the get_hyper() response cache counters.
+
+        Returns:
+            Optional[Dict[str, int]]: Hits, misses, evictions, size and
+                maxsize, or None when the cache is disabled.
+        """
+        if self.__responses is None:
+            return None
+        return self.__responses.stats()
+
+    def get_pages(self, requests: Iterable[Tuple[int, int]],
+                  filters: Dict[str, str] = None,
+                  order_by: str = None,
+                  view: DatasetView = None) -> List[Dict]:
+        """Resolves many pages against one view in a single pass.
+
+        Filters and ordering are resolved and the row count taken once
+        for the whole batch, and each page's data is a read-only PageView
+        over the shared row storage rather than a copy.
+
+        Args:
+            requests (Iterable[Tuple[int, int]]): (page, page_size) pairs.
+            filters (Dict[str, str]): Applied to every page, see select().
+            order_by (str): Applied to every page, see select().
+            view (DatasetView): The view to page through, e.g. one whose
+                generation the caller already recorded; the current view
+                if None.
+
+        Returns:
+            List[Dict]: One get_hyper()-shaped dictionary per request, in
+                request order.
+        """
+        if view is None:
+            view = self.view()
+        row_ids = view.select(filters, order_by)
+        total_data = view.length if row_ids is None else len(row_ids)
+        total_pages = {}
+        results = []
+        for page, page_size in requests:
+            assert isinstance(page, int) and isinstance(page_size, int), \
+                "Page and page_size must be integers."
+            assert page > 0 and page_size > 0, \
+                "Page and page_size must be greater than zero."
+
+            start_index, end_index = index_range(page, page_size)
+            if page_size not in total_pages:
+                total_pages[page_size] = math.ceil(total_data / page_size)
+            data_page = PageView(view.rows, min(start_index, total_data),
+                                 min(end_index, total_data), row_ids)
+            results.append({
+                'page_size': len(data_page),
+                'page': page,
+                'data': data_page,
+                'next_page': page + 1 if end_index < total_data else None,
+                'prev_page': page - 1 if start_index > 0 else None,
+                'total_pages': total_pages[page_size],
+            })
+        return results
+
+    def search(self, prefix: str, page: int = 1, page_size: int = 10) -> Dict:
+        """Pages through rows whose SEARCH_COLUMN starts with prefix.
+
+        Matching is case-insensitive and results are ordered by name. The
+        lookup costs two binary searches and only the requested page of
+        matches is materialized.
+
+        Args:
+            prefix (str): The name prefix to look up.
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary shaped like get_hyper() for the matches.
+        """
+        assert isinstance(prefix, str), "prefix must be a string."
+        assert isinstance(page, int) and isinstance(page_size, int), \
+            "Page and page_size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page_size must be greater than zero."
+
+        view = self.view()
+        data = view.rows
+        prefix_index = view.prefix_index(self.SEARCH_COLUMN)
+        first, last = prefix_index.match_range(prefix)
+        start_index, end_index = index_range(page, page_size)
+        row_ids = prefix_index.row_ids(
+            min(first + start_index, last), min(first + end_index, last))
+        total_data = last - first
+
+        return {
+            'page_size': len(row_ids),
+            'page': page,
+            'data': [data[i] for i in row_ids],
+            'next_page': page + 1 if end_index < total_data else None,
+            'prev_page': page - 1 if start_index > 0 else None,
+            'total_pages': math.ceil(total_data / page_size),
+        }
+
+    def iter_rows(self, start: int = 0, stop: int = None) -> Iterator[List]:
+        """Streams rows [start, stop) straight from the CSV reader.
+
+        Nothing is cached, so memory stays constant however many rows
+        are read, and the first row is available as soon as it is parsed.
+
+        Args:
+            start (int): Index of the first row (0-indexed, header excluded).
+            stop (int): Index one past the last row, or None for all rows.
+
+        Yields:
+            List: One row at a time.
+        """
+        assert isinstance(start, int) and start >= 0, \
+            "start must be a non-negative integer."
+        assert stop is None or (isinstance(stop, int) and stop >= 0), \
+            "stop must be a non-negative integer or None."
+
+        with open(self.DATA_FILE, newline='') as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip header
+            yield from islice(reader, start, stop)
+
+    def iter_pages(self, page_size: int = 10,
+                   page: int = 1) -> Iterator[List[List]]:
+        """Streams consecutive pages straight from the CSV reader.
+
+        Each page is yielded as soon as its rows are parsed.
+
+        Args:
+            page_size (int): The number of items per page.
+            page (int): The page to start from (1-indexed).
+
+        Yields:
+            List[List]: The rows of one page; only the last may be short.
+        """
+        assert isinstance(page, int) and isinstance(page_size, int), \
+            "Page and page_size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page_size must be greater than zero."
 
+        start_index, _ = index_range(page, page_size)
+        rows = self.iter_rows(start_index)
+        while True:
+            data_page = list(islice(rows, page_size))
+            if not data_page:
+                return
+            yield data_page
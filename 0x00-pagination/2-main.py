@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+
+Server = __import__('2-hypermedia_pagination').Server
+
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "names.csv")
+
+for mode in ({}, {'columnar': True}, {'mmap_rows': True},
+             {'parallel': True}, {'snapshot': True}):
+    print(mode)
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+
+    # The last row is still being written
+    with open(path, "w") as file:
+        file.write('id,name\n1,Ada\n2,Alan\n3,"Gra')
+
+    class NamesServer(Server):
+        DATA_FILE = path
+
+    server = NamesServer(**mode)
+    print(server.get_hyper(1, 10)['data'])
+    print(list(server.select({'name': 'Ada'})))
+
+    # Replaced before the first refresh: everything is reloaded
+    with open(path + ".tmp", "w") as file:
+        file.write('id,name\n4,Ada\n5,Barbara\n')
+    os.replace(path + ".tmp", path)
+    print(server.refresh(), server.get_hyper(1, 10)['data'])
+
+    # Appended rows, one with a quoted newline and one still partial
+    with open(path, "a") as file:
+        file.write('6,Ada\n7,"Edsger\nW."\n8,Do')
+    print(server.refresh(), server.get_hyper(1, 10)['data'])
+    print(list(server.select({'name': 'Ada'})))
+    print(server.refresh())
+
+    # The partial row completes
+    with open(path, "a") as file:
+        file.write('nald\n')
+    print(server.refresh(), server.get_hyper(2, 3))
+
+shutil.rmtree(directory)
+
+# A truncated or corrupt snapshot is rebuilt from the CSV
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "names.csv")
+with open(path, "w") as file:
+    file.write('id,name\n1,Ada\n2,Alan\n3,Grace\n')
+
+
+class SnapshotServer(Server):
+    DATA_FILE = path
+
+
+print(SnapshotServer(snapshot=True).get_hyper(1, 2)['data'])
+snapshot = path + ".snap"
+size = os.path.getsize(snapshot)
+for damage in (lambda data: data[:len(data) // 2],
+               lambda data: data[:60] + b"\xff" * 40 + data[100:]):
+    with open(snapshot, "rb") as file:
+        data = file.read()
+    with open(snapshot, "wb") as file:
+        file.write(damage(data))
+    print(SnapshotServer(snapshot=True).get_hyper(1, 2)['data'],
+          os.path.getsize(snapshot) == size)
+shutil.rmtree(directory)
+
+# Cached responses survive callers editing them and end with a reload
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "names.csv")
+with open(path, "w") as file:
+    file.write('id,name\n1,Ada\n2,Alan\n3,Grace\n')
+
+
+class CachedServer(Server):
+    DATA_FILE = path
+
+
+server = CachedServer(cache_size=8)
+response = server.get_hyper(1, 2)
+response['data'][0][1] = "Eve"
+response['data'].clear()
+print(server.get_hyper(1, 2)['data'], server.get_hyper(1, 2) is not response)
+with open(path, "a") as file:
+    file.write('4,Ada\n')
+server.refresh()
+print(server.get_hyper(2, 2)['data'], server.get_hyper(2, 2)['data'])
+print(server.cache_stats())
+shutil.rmtree(directory)
+
+# A last row without its newline is served, in every mode alike
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "names.csv")
+for mode in ({}, {'columnar': True}, {'mmap_rows': True},
+             {'parallel': True}, {'snapshot': True}):
+    with open(path, "w") as file:
+        file.write('id,name\n1,Ada\n2,Alan')
+
+    class UnterminatedServer(Server):
+        DATA_FILE = path
+
+    server = UnterminatedServer(**mode)
+    print(mode, server.get_hyper(1, 10)['data'])
+    with open(path, "a") as file:
+        file.write('\n3,Grace\n')
+    print(server.refresh(), server.get_hyper(1, 10)['data'])
+shutil.rmtree(directory)
+
+# A view grabbed before a refresh still pages through its own rows
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "names.csv")
+with open(path, "w") as file:
+    file.write('id,name\n1,Ada\n2,Alan\n')
+
+
+class SnapshotViewServer(Server):
+    DATA_FILE = path
+
+
+server = SnapshotViewServer()
+old = server.view()
+server.get_hyper(1, 10, {'name': 'Ada'})
+with open(path, "a") as file:
+    file.write('3,Ada\n')
+server.refresh()
+print(old.generation, list(server.get_pages([(1, 10)], view=old)[0]['data']))
+print(list(server.get_pages([(1, 10)], {'name': 'Ada'}, view=old)[0]['data']))
+print(server.view().generation, server.get_hyper(1, 10, {'name': 'Ada'}))
+shutil.rmtree(directory)
+
+# Rows and pages streamed straight from the CSV, nothing loaded
+server = Server()
+server.DATA_FILE = "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"
+pages = server.iter_pages(3, page=6465)
+print([len(page) for page in pages], server.ready())
+print(list(server.iter_rows(2, 4)) == server.dataset()[2:4])
+print(list(server.iter_rows(5, 2)))
+try:
+    list(server.iter_rows(0, -1))
+except AssertionError as error:
+    print("AssertionError:", error)
@@ -1,8 +1,41 @@
 #!/usr/bin/env python3
 """Deletion-resilient hypermedia pagination
 """
+import base64
+import binascii
 import csv
-from typing import Dict, List
+import struct
+from typing import Callable, Dict, List, Tuple
+
+from fenwick_tree import FenwickTree
+from lazy_loader import LazyLoader
+
+
+class LiveRows(dict):
+    """The live rows by index, kept in step with the Server's tombstones.
+
+    Deleting a key, with del or pop(), deletes the row from the Server,
+    so later pages skip it just as if delete() had been called.
+    """
+
+    def __init__(self, rows: Dict[int, List], delete: Callable[[int], List]):
+        """Initializes the mapping, reporting deletions to delete."""
+        super().__init__(rows)
+        self.__delete = delete
+
+    def __delitem__(self, index: int) -> None:
+        """Deletes the row at index from the Server."""
+        if index not in self:
+            raise KeyError(index)
+        self.__delete(index)
+
+    def pop(self, index: int, *default):
+        """Deletes the row at index from the Server and returns it."""
+        if index not in self:
+            if default:
+                return default[0]
+            raise KeyError(index)
+        return self.__delete(index)
 
 
 class Server:
@@ -12,69 +45,282 @@ class Server:
         DATA_FILE (str): Path to the dataset file.
     """
     DATA_FILE = "Popular_Baby_Names.csv"
+    CURSOR_VERSION = 1
+    CURSOR_FORMAT = ">BQQ"
+
+    def __init__(self, warm: bool = False):
+        """Initializes a new Server instance, with dataset and indexed
+        dataset as None.
 
-    def __init__(self):
-        """Initializes a new Server instance, with dataset and indexed dataset as None."""
-        self.__dataset = None
-        self.__indexed_dataset = None
+        Loading is lazy and single-flight: when several threads ask for
+        the dataset at once, one parses the CSV and the others wait for it.
+
+        Args:
+            warm (bool): Start loading on a background thread right away;
+                see ready() and wait_ready().
+        """
+        self.__dataset = LazyLoader(self.__parse)
+        self.__indexed_dataset = LazyLoader(self.__index_live_rows)
+        self.__tombstones = None
+        self.__live = LazyLoader(self.__count_live_rows)
+        self.__generation = 0
+        if warm:
+            self.__live.start()
 
     def dataset(self) -> List[List]:
         """Loads the dataset from the CSV file if not already loaded.
 
+        Rows added with insert() are appended here and deleted rows are
+        kept in place, so a row's position is its permanent index.
+
         Returns:
             List[List]: The dataset, excluding the header row.
         """
-        if self.__dataset is None:
-            with open(self.DATA_FILE) as file:
-                reader = csv.reader(file)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]  # Exclude header
+        return self.__dataset.get()
+
+    def __parse(self) -> List[List]:
+        """Parses every row of DATA_FILE except the header."""
+        with open(self.DATA_FILE) as file:
+            reader = csv.reader(file)
+            dataset = [row for row in reader]
+        return dataset[1:]  # Exclude header
+
+    def ready(self) -> bool:
+        """Tells whether the dataset is loaded and pages can be served."""
+        return self.__live.ready()
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        """Blocks until the dataset is loaded or timeout seconds pass.
+
+        Returns:
+            bool: True if the dataset is loaded.
+
+        Raises:
+            Exception: What loading raised, if it failed.
+        """
+        return self.__live.wait(timeout)
 
-        return self.__dataset
+    def __live_counts(self) -> FenwickTree:
+        """Returns the live-count tree, building it and the tombstone bitmap
+        on first use.
+
+        Returns:
+            FenwickTree: One count per index, 1 if the row is live.
+        """
+        return self.__live.get()
+
+    def __count_live_rows(self) -> FenwickTree:
+        """Builds the tombstone bitmap and live-count tree over the dataset."""
+        size = len(self.dataset())
+        self.__tombstones = bytearray(size)
+        return FenwickTree([1] * size)
 
     def indexed_dataset(self) -> Dict[int, List]:
-        """Creates and caches an indexed dataset, limited to the first 1000 entries.
+        """Creates and caches an index of the live rows of the dataset.
+
+        Deleting a key from it deletes that row, like delete() does.
+
+        Returns:
+            Dict[int, List]: A dictionary mapping each index to the
+                corresponding data row.
+        """
+        return self.__indexed_dataset.get()
+
+    def __index_live_rows(self) -> Dict[int, List]:
+        """Maps the index of every live row to the row."""
+        dataset = self.dataset()
+        self.__live_counts()
+        tombstones = self.__tombstones
+        return LiveRows({i: dataset[i] for i in range(len(dataset))
+                         if not tombstones[i]}, self.delete)
+
+    def is_deleted(self, index: int) -> bool:
+        """Tells whether the row at index has been deleted.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            bool: True if the row is tombstoned.
+        """
+        self.__live_counts()
+        return bool(self.__tombstones[index])
+
+    def delete(self, index: int) -> List:
+        """Deletes the row at index, leaving every other index unchanged.
+
+        Args:
+            index (int): The index of the row to delete.
+
+        Returns:
+            List: The deleted row.
+
+        Raises:
+            AssertionError: If the index is out of range or already deleted.
+        """
+        live = self.__live_counts()
+        assert 0 <= index < len(live) and not self.__tombstones[index], \
+            "Invalid index"
+
+        self.__tombstones[index] = 1
+        live.add(index, -1)
+        self.__generation += 1
+        if self.__indexed_dataset.ready():
+            dict.__delitem__(self.__indexed_dataset.get(), index)
+        return self.dataset()[index]
+
+    def insert(self, row: List) -> int:
+        """Appends a row to the dataset.
+
+        Args:
+            row (List): The row to insert.
 
         Returns:
-            Dict[int, List]: A dictionary mapping each index to the corresponding data row.
+            int: The index assigned to the new row.
         """
-        if self.__indexed_dataset is None:
-            dataset = self.dataset()[:1000]
-            self.__indexed_dataset = {i: dataset[i] for i in range(len(dataset))}
-        
-        return self.__indexed_dataset
+        live = self.__live_counts()
+        dataset = self.dataset()
+        index = len(dataset)
+
+        dataset.append(row)
+        self.__tombstones.append(0)
+        live.append(1)
+        self.__generation += 1
+        if self.__indexed_dataset.ready():
+            self.__indexed_dataset.get()[index] = row
+        return index
+
+    def generation(self) -> int:
+        """Returns a counter bumped by every delete and insert."""
+        return self.__generation
+
+    def live_position(self, index: int) -> int:
+        """Returns how many live rows precede index.
+
+        Args:
+            index (int): The index of a row, live or deleted.
+
+        Returns:
+            int: The 0-based position index would have among live rows.
+        """
+        return self.__live_counts().prefix_sum(index)
 
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
-        """Retrieves a page of data, starting from the given index and with a specified size.
+        """Retrieves a page of data, starting from the given index and with a
+        specified size.
+
+        Deleted rows are skipped, so consecutive pages never miss a live
+        row. Each returned row costs O(log n) regardless of how many rows
+        were deleted before it.
 
         Args:
             index (int): The start index for retrieving the page.
             page_size (int): The number of records per page.
 
         Returns:
-            Dict: A dictionary containing the current index, next index, page size, and page data.
+            Dict: A dictionary containing the current index, next index,
+                page size, and page data.
 
         Raises:
             AssertionError: If the index is not valid or out of range.
         """
-        data = self.indexed_dataset()
-        assert index is not None and 0 <= index < len(data), "Invalid index"
-
-        page_data = []
-        current_index = index
-        next_index = None
+        live = self.__live_counts()
+        assert index is not None and 0 <= index < len(live), "Invalid index"
 
-        while len(page_data) < page_size and current_index < len(data):
-            page_data.append(data[current_index])
-            current_index += 1
+        first = live.prefix_sum(index)
+        keys, more = self.__live_keys(first, page_size)
 
-        # Set the next index if more data is available
-        next_index = current_index if current_index < len(data) else None
+        # Set the next index if more live data follows the page
+        next_index = keys[-1] + 1 if more else None
 
         return {
             'index': index,
             'next_index': next_index,
-            'page_size': len(page_data),
-            'data': page_data,
+            'page_size': len(keys),
+            'data': self.__rows_at(keys),
+        }
+
+    def get_hyper_cursor(self, cursor: str = None,
+                         page_size: int = 10) -> Dict:
+        """Retrieves the page of live rows following an opaque cursor.
+
+        The cursor remembers the last index served, so resuming costs
+        O(log n) no matter how deep the client has paged, and rows
+        deleted or inserted in between never shift the next page.
+
+        Args:
+            cursor (str): A next_cursor from a previous call, or None to
+                start from the beginning.
+            page_size (int): The number of records per page.
+
+        Returns:
+            Dict: The cursor, next cursor, page size, page data, and
+                whether the dataset changed since the cursor was issued.
+
+        Raises:
+            AssertionError: If the cursor is malformed or page_size is not
+                positive.
+        """
+        assert isinstance(page_size, int) and page_size > 0, \
+            "page_size must be a positive integer"
+        live = self.__live_counts()
+        generation, start = 0, 0
+        if cursor is not None:
+            generation, last_key = self.__decode_cursor(cursor)
+            start = last_key + 1
+        keys, more = self.__live_keys(live.prefix_sum(start), page_size)
+
+        return {
+            'cursor': cursor,
+            'next_cursor': self.__encode_cursor(keys[-1]) if more else None,
+            'page_size': len(keys),
+            'data': self.__rows_at(keys),
+            'changed': cursor is not None and generation != self.__generation,
         }
 
+    def __live_keys(self, first: int,
+                    page_size: int) -> Tuple[List[int], bool]:
+        """Selects the indexes of up to page_size live rows by rank.
+
+        Args:
+            first (int): 0-based live rank of the first row.
+            page_size (int): The number of rows wanted.
+
+        Returns:
+            Tuple[List[int], bool]: The indexes, and whether live rows
+                remain after them.
+        """
+        live = self.__live_counts()
+        last = min(first + page_size, live.total())
+        keys = [live.find(rank) for rank in range(first + 1, last + 1)]
+        return keys, bool(keys) and last < live.total()
+
+    def __rows_at(self, keys: List[int]) -> List[List]:
+        """Returns the rows stored at the given indexes."""
+        data = self.dataset()
+        return [data[key] for key in keys]
+
+    def __encode_cursor(self, last_key: int) -> str:
+        """Packs the last served index and dataset generation into a token."""
+        raw = struct.pack(self.CURSOR_FORMAT, self.CURSOR_VERSION,
+                          self.__generation, last_key)
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    def __decode_cursor(self, cursor: str) -> Tuple[int, int]:
+        """Unpacks a token made by __encode_cursor.
+
+        Returns:
+            Tuple[int, int]: The generation and last served index.
+
+        Raises:
+            AssertionError: If the token is malformed or of another version.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            version, generation, last_key = struct.unpack(
+                self.CURSOR_FORMAT, raw)
+        except (binascii.Error, struct.error, TypeError, ValueError):
+            raise AssertionError("Invalid cursor")
+        assert version == self.CURSOR_VERSION, "Unsupported cursor version"
+        assert last_key < len(self.__live_counts()), "Invalid cursor"
+        return generation, last_key
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('3-hypermedia_del_pagination').Server
+Server.DATA_FILE = "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"
+
+server = Server()
+
+# Walk the first pages with cursors
+page = server.get_hyper_cursor(None, 3)
+print(page)
+cursor = page['next_cursor']
+page = server.get_hyper_cursor(cursor, 3)
+print(page)
+
+# Deleting a row already served, and one not served yet, shifts nothing
+server.delete(1)
+server.delete(6)
+page = server.get_hyper_cursor(page['next_cursor'], 3)
+print(page)
+print(page['changed'])
+
+# The index-based API agrees with the cursor
+print(server.get_hyper_index(3, 3))
+
+# A replayed cursor from before the deletes reports the change
+print(server.get_hyper_cursor(cursor, 3)['changed'])
+
+# A tampered cursor is refused
+try:
+    server.get_hyper_cursor(cursor[:-2] + "!!", 3)
+except AssertionError as error:
+    print("AssertionError:", error)
+
+# Deleting from indexed_dataset() deletes the row too
+indexed = server.indexed_dataset()
+res = server.get_hyper_index(10, 2)
+print(res)
+del indexed[res.get('index')]
+print(server.is_deleted(10), server.get_hyper_index(10, 2))
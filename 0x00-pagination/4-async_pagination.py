@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""asyncio-native pagination
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, TypeVar
+
+from row_index import RowIndex
+
+Server = __import__('2-hypermedia_pagination').Server
+DelServer = __import__('3-hypermedia_del_pagination').Server
+
+T = TypeVar('T')
+
+
+class AsyncServer:
+    """Awaitable counterpart of the pagination Servers.
+
+    Loading runs in an executor and every concurrent awaiter shares the
+    one load in flight. Plain pages are then sliced on the event loop.
+    Filtered, ordered and searched pages run in the executor, because
+    their first call builds an index in O(n log n). So do pages read
+    from mmap, which may fault in from disk.
+    """
+
+    def __init__(self, server: Server = None, del_server: DelServer = None,
+                 executor: Executor = None):
+        """Initializes an AsyncServer over synchronous Servers.
+
+        Args:
+            server (Server): Serves get_page() and get_hyper(); a default
+                Server if None.
+            del_server (DelServer): Serves get_hyper_index(); a default
+                deletion-resilient Server if None.
+            executor (Executor): Where blocking work runs; the loop's
+                default executor if None.
+        """
+        self.__server = server or Server()
+        self.__del_server = del_server or DelServer()
+        self.__executor = executor
+        self.__loads = {}
+
+    async def __run(self, call: Callable[..., T], *args) -> T:
+        """Runs call(*args) in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, call, *args)
+
+    async def __loaded(self, server, load: Callable[[], object]) -> None:
+        """Waits until server is loaded, starting the load if needed.
+
+        The load is shielded so that one cancelled awaiter does not
+        cancel it for the others.
+        """
+        if server.ready():
+            return
+        pending = self.__loads.get(id(server))
+        if pending is None:
+            pending = asyncio.ensure_future(self.__run(load))
+            self.__loads[id(server)] = pending
+            pending.add_done_callback(
+                lambda _: self.__loads.pop(id(server), None))
+        await asyncio.shield(pending)
+
+    async def __serve(self, call: Callable[..., T], *args,
+                      indexed: bool = False) -> T:
+        """Loads the hypermedia Server, then runs call(*args) on it.
+
+        Args:
+            indexed (bool): Whether call may build an index, which would
+                block the event loop.
+        """
+        await self.__loaded(self.__server, self.__server.view)
+        if indexed or isinstance(self.__server.rows(), RowIndex):
+            return await self.__run(call, *args)
+        return call(*args)
+
+    async def get_page(self, page: int = 1, page_size: int = 10,
+                       filters: Dict[str, str] = None,
+                       order_by: str = None) -> List[List]:
+        """Awaitable Server.get_page()."""
+        return await self.__serve(self.__server.get_page,
+                                  page, page_size, filters, order_by,
+                                  indexed=bool(filters or order_by))
+
+    async def get_hyper(self, page: int = 1, page_size: int = 10,
+                        filters: Dict[str, str] = None,
+                        order_by: str = None) -> Dict:
+        """Awaitable Server.get_hyper()."""
+        return await self.__serve(self.__server.get_hyper,
+                                  page, page_size, filters, order_by,
+                                  indexed=bool(filters or order_by))
+
+    async def search(self, prefix: str, page: int = 1,
+                     page_size: int = 10) -> Dict:
+        """Awaitable Server.search()."""
+        return await self.__serve(self.__server.search,
+                                  prefix, page, page_size, indexed=True)
+
+    async def get_hyper_index(self, index: int = None,
+                              page_size: int = 10) -> Dict:
+        """Awaitable deletion-resilient Server.get_hyper_index()."""
+        server = self.__del_server
+        await self.__loaded(server, lambda: server.live_position(0))
+        return server.get_hyper_index(index, page_size)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import asyncio
+
+AsyncServer = __import__('4-async_pagination').AsyncServer
+Server = __import__('2-hypermedia_pagination').Server
+DelServer = __import__('3-hypermedia_del_pagination').Server
+Server.DATA_FILE = "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"
+DelServer.DATA_FILE = Server.DATA_FILE
+
+
+async def responsive(call):
+    """Awaits call() and tells whether the loop ran meanwhile."""
+    ticks = 0
+    done = False
+
+    async def tick():
+        nonlocal ticks
+        while not done:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker = asyncio.ensure_future(tick())
+    await asyncio.sleep(0)
+    start = ticks
+    result = await call()
+    done = True
+    await ticker
+    return result, ticks > start
+
+
+async def main():
+    """Pages through the dataset concurrently."""
+    server = AsyncServer()
+
+    # Concurrent first requests share one load
+    pages = await asyncio.gather(*(server.get_page(page, 2)
+                                   for page in (1, 2, 3)))
+    for page in pages:
+        print(page)
+
+    # Index-building requests leave the event loop free
+    hyper, free = await responsive(
+        lambda: server.get_hyper(1, 2, {'Gender': 'MALE'}, 'Count desc'))
+    print(hyper['data'], hyper['total_pages'], free)
+    found, free = await responsive(lambda: server.search('Oli', 1, 2))
+    print(found['data'], free)
+
+    print(await server.get_hyper_index(10, 2))
+
+
+asyncio.run(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Flask app serving hypermedia pagination as JSON or streamed NDJSON.
+
+The data comes from the bundled CSV, or the file named by the
+PAGINATION_DATA_FILE environment variable.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Iterator
+
+from flask import Flask, Response, jsonify, request
+
+HyperServer = __import__('2-hypermedia_pagination').Server
+IndexServer = __import__('3-hypermedia_del_pagination').Server
+
+NDJSON = "application/x-ndjson"
+RESERVED_ARGS = {"page", "page_size", "order_by", "index", "format"}
+DATA_FILE = os.environ.get("PAGINATION_DATA_FILE", os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"))
+
+
+class Server(HyperServer):
+    """Hypermedia Server over DATA_FILE."""
+    DATA_FILE = DATA_FILE
+
+
+class DelServer(IndexServer):
+    """Deletion-resilient Server over DATA_FILE."""
+    DATA_FILE = DATA_FILE
+
+
+# Initialize the Flask application and start loading both datasets
+app = Flask(__name__)
+app.url_map.strict_slashes = False
+server = Server(warm=True)
+del_server = DelServer(warm=True)
+
+
+def wants_ndjson() -> bool:
+    """Tells whether the client asked for NDJSON, by ?format= or Accept."""
+    if "format" in request.args:
+        return request.args["format"] == "ndjson"
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON])
+    return best == NDJSON
+
+
+def make_etag(*parts) -> str:
+    """Hashes the parts identifying a representation into an ETag value."""
+    encoded = json.dumps(parts, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def ndjson_lines(meta: Dict, rows: Iterable) -> Iterator[str]:
+    """Yields the metadata line, then one line per row."""
+    yield json.dumps(meta) + "\n"
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def respond(meta: Dict, rows: Iterable, etag: str) -> Response:
+    """Builds a 304, a streamed NDJSON or a JSON response for a page.
+
+    The ETag covers the dataset generation and the output format, so
+    a client revalidating with If-None-Match gets a 304 until the data
+    behind the page changes.
+    """
+    ndjson = wants_ndjson()
+    etag = make_etag(etag, ndjson)
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    elif ndjson:
+        response = Response(ndjson_lines(meta, rows), mimetype=NDJSON)
+    else:
+        response = jsonify(dict(meta, data=list(rows)))
+    response.set_etag(etag)
+    response.vary.add("Accept")
+    return response
+
+
+@app.errorhandler(AssertionError)
+def bad_request(error: AssertionError):
+    """Turns the Servers' argument checks into 400 responses."""
+    return jsonify(error=str(error)), 400
+
+
+@app.route("/hyper")
+def hyper() -> Response:
+    """Serves Server.get_hyper().
+
+    Query args: page, page_size, order_by, and any other arg is taken as
+    a column filter, e.g. /hyper?page=2&Gender=FEMALE&order_by=Count+desc.
+    """
+    page = request.args.get("page", 1, type=int)
+    page_size = request.args.get("page_size", 10, type=int)
+    order_by = request.args.get("order_by")
+    filters = {name: value for name, value in request.args.items()
+               if name not in RESERVED_ARGS}
+
+    # Page from the same view the ETag names, even if a refresh lands
+    view = server.view()
+    result = server.get_pages([(page, page_size)], filters, order_by,
+                              view)[0]
+    stat = os.stat(Server.DATA_FILE)
+    rows = result.pop("data")
+    etag = make_etag(stat.st_size, stat.st_mtime_ns, view.generation,
+                     page, page_size, order_by, sorted(filters.items()))
+    return respond(result, rows, etag)
+
+
+@app.route("/hyper_index")
+def hyper_index() -> Response:
+    """Serves the deletion-resilient Server.get_hyper_index().
+
+    Query args: index and page_size.
+    """
+    index = request.args.get("index", 0, type=int)
+    page_size = request.args.get("page_size", 10, type=int)
+
+    # Read the generation first, so the ETag never names newer rows
+    generation = del_server.generation()
+    result = del_server.get_hyper_index(index, page_size)
+    stat = os.stat(DelServer.DATA_FILE)
+    rows = result.pop("data")
+    etag = make_etag(stat.st_size, stat.st_mtime_ns, generation,
+                     index, page_size)
+    return respond(result, rows, etag)
+
+
+# Entry point for running the app
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000)
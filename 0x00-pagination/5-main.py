@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import json
+
+app = __import__('5-app').app
+client = app.test_client()
+
+# A JSON page, then a 304 when revalidated with its ETag
+response = client.get("/hyper?page=2&page_size=2")
+print(response.status_code, response.mimetype, response.get_json())
+etag = response.headers["ETag"]
+response = client.get("/hyper?page=2&page_size=2",
+                      headers={"If-None-Match": etag})
+print(response.status_code, response.data)
+
+# Another page or format gets another ETag
+response = client.get("/hyper?page=3&page_size=2",
+                      headers={"If-None-Match": etag})
+print(response.status_code, response.headers["ETag"] != etag)
+
+# Filters and ordering, streamed as NDJSON
+response = client.get("/hyper?page=1&page_size=2&Gender=MALE"
+                      "&order_by=Count+desc",
+                      headers={"Accept": "application/x-ndjson"})
+print(response.status_code, response.mimetype)
+for line in response.get_data(as_text=True).splitlines():
+    print(json.loads(line))
+
+# The deletion-resilient index
+response = client.get("/hyper_index?index=10&page_size=2&format=ndjson")
+print(response.status_code, response.get_data(as_text=True).count("\n"))
+etag = response.headers["ETag"]
+response = client.get("/hyper_index?index=10&page_size=2&format=ndjson",
+                      headers={"If-None-Match": etag})
+print(response.status_code)
+
+# Bad arguments are refused
+for url in ("/hyper?page=0", "/hyper?page_size=-1",
+            "/hyper?Nope=1", "/hyper_index?index=-5"):
+    response = client.get(url)
+    print(url, response.status_code, response.get_json())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmarks for the pagination helpers and Servers.
+
+Runs every (dataset scale, storage mode) scenario in its own process so
+that cold load time and peak RSS are not skewed by earlier scenarios,
+and prints one JSON document with all results:
+
+    ./6-benchmark.py --scales 1 10 100 --output results.json
+    ./6-benchmark.py --compare results.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BUNDLED_CSV = os.path.join(
+    HERE, "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv")
+MODES = {
+    "list": {},
+    "columnar": {"columnar": True},
+    "mmap": {"mmap_rows": True},
+    "snapshot": {"snapshot": True},
+}
+PAGE_SIZE = 100
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """Summarizes latencies in microseconds."""
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    return {
+        "p50_us": round(at(0.50) * 1e6, 3),
+        "p90_us": round(at(0.90) * 1e6, 3),
+        "p99_us": round(at(0.99) * 1e6, 3),
+        "max_us": round(ordered[-1] * 1e6, 3),
+        "calls": len(ordered),
+    }
+
+
+def measure(call: Callable[[], object], calls: int) -> Dict[str, float]:
+    """Times calls invocations of call, one sample per invocation."""
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def scaled_csv(scale: int, directory: str) -> str:
+    """Writes the bundled CSV's rows repeated scale times, or reuses it."""
+    if scale == 1:
+        return BUNDLED_CSV
+    path = os.path.join(directory, "baby_names_x{}.csv".format(scale))
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        with open(BUNDLED_CSV, "rb") as source:
+            header = source.readline()
+            body = source.read()
+        if not body.endswith(b"\n"):
+            body += b"\n"
+        with open(path + ".tmp", "wb") as target:
+            target.write(header)
+            for _ in range(scale):
+                target.write(body)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def peak_rss_kb() -> int:
+    """Returns this process's peak resident set size in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_scenario(path: str, mode: str, calls: int) -> Dict:
+    """Benchmarks one dataset file in one storage mode, in this process."""
+    sys.path.insert(0, HERE)
+    index_range = __import__('0-simple_helper_function').index_range
+    HyperServer = __import__('2-hypermedia_pagination').Server
+    DelServer = __import__('3-hypermedia_del_pagination').Server
+
+    class Server(HyperServer):
+        DATA_FILE = path
+
+    class IndexServer(DelServer):
+        DATA_FILE = path
+
+    baseline_rss = peak_rss_kb()
+    server = Server(**MODES[mode])
+    start = time.perf_counter()
+    total = len(server.rows())
+    cold_load = time.perf_counter() - start
+    last_page = max((total + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+
+    results = {
+        "rows": total,
+        "cold_load_s": round(cold_load, 6),
+        "index_range": measure(lambda: index_range(last_page, PAGE_SIZE),
+                               calls),
+        "get_page_shallow": measure(lambda: server.get_page(1, PAGE_SIZE),
+                                    calls),
+        "get_page_deep": measure(lambda: server.get_page(last_page, PAGE_SIZE),
+                                 calls),
+        "get_hyper_shallow": measure(lambda: server.get_hyper(1, PAGE_SIZE),
+                                     calls),
+        "get_hyper_deep": measure(
+            lambda: server.get_hyper(last_page, PAGE_SIZE), calls),
+    }
+    if mode == "list":
+        index_server = IndexServer()
+        start = time.perf_counter()
+        index_server.get_hyper_index(0, PAGE_SIZE)
+        results["get_hyper_index_cold_s"] = round(time.perf_counter() - start,
+                                                  6)
+        deep = max(total - PAGE_SIZE, 0)
+        results["get_hyper_index_shallow"] = measure(
+            lambda: index_server.get_hyper_index(0, PAGE_SIZE), calls)
+        results["get_hyper_index_deep"] = measure(
+            lambda: index_server.get_hyper_index(deep, PAGE_SIZE), calls)
+    results["peak_rss_kb"] = peak_rss_kb()
+    results["rss_growth_kb"] = results["peak_rss_kb"] - baseline_rss
+    return results
+
+
+def git_revision() -> str:
+    """Returns the current commit of the repository, if there is one."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_all(scales: List[int], modes: List[str], calls: int,
+            directory: str) -> Dict:
+    """Runs every scenario in a fresh interpreter and collects the results."""
+    scenarios = []
+    for scale in scales:
+        path = scaled_csv(scale, directory)
+        for mode in modes:
+            if mode == "snapshot":
+                # Build the snapshot first so the run measures a warm start
+                subprocess.run([sys.executable, __file__, "--scenario", path,
+                                mode, "1"], check=True, capture_output=True)
+            output = subprocess.run(
+                [sys.executable, __file__, "--scenario", path, mode,
+                 str(calls)],
+                check=True, capture_output=True, text=True).stdout
+            scenarios.append(dict(scale=scale, mode=mode,
+                                  **json.loads(output)))
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "page_size": PAGE_SIZE,
+        "scenarios": scenarios,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """Lists the metrics that got more than threshold times slower."""
+    previous = {(s["scale"], s["mode"]): s for s in baseline["scenarios"]}
+    regressions = []
+    for scenario in current["scenarios"]:
+        before = previous.get((scenario["scale"], scenario["mode"]))
+        if before is None:
+            continue
+        for metric, value in scenario.items():
+            old = before.get(metric)
+            if isinstance(value, dict):
+                value, old = value["p50_us"], (old or {}).get("p50_us")
+            elif metric not in ("cold_load_s", "peak_rss_kb"):
+                continue
+            if old and value > old * threshold:
+                regressions.append("x{} {} {}: {} -> {} ({:.2f}x)".format(
+                    scenario["scale"], scenario["mode"], metric, old, value,
+                    value / old))
+    return regressions
+
+
+def main() -> int:
+    """Parses the command line and runs the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10],
+                        help="dataset sizes as multiples of the bundled CSV")
+    parser.add_argument("--modes", nargs="+", default=list(MODES),
+                        choices=list(MODES))
+    parser.add_argument("--calls", type=int, default=200,
+                        help="timed calls per operation")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(),
+                        help="where synthetic datasets are written")
+    parser.add_argument("--output", help="write results here, not stdout")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="report p50, load and RSS regressions "
+                             "against a previous results file")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="slowdown ratio that counts as a regression")
+    parser.add_argument("--scenario", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        path, mode, calls = args.scenario
+        print(json.dumps(run_scenario(path, mode, int(calls))))
+        return 0
+
+    results = run_all(args.scales, args.modes, args.calls, args.data_dir)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), results, args.threshold)
+        for line in regressions:
+            print("REGRESSION:", line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import copy
+import tempfile
+
+benchmark = __import__('6-benchmark')
+
+with tempfile.TemporaryDirectory() as directory:
+    results = benchmark.run_all([1, 2], list(benchmark.MODES), 5, directory)
+
+for scenario in results['scenarios']:
+    print(scenario['scale'], scenario['mode'], scenario['rows'],
+          sorted(key for key, value in scenario.items()
+                 if isinstance(value, dict)))
+
+# A run compared with itself has no regressions
+print(benchmark.compare(results, results, 1.2))
+
+# A baseline twice as fast flags the slower metric
+baseline = copy.deepcopy(results)
+baseline['scenarios'][0]['get_page_deep']['p50_us'] /= 2
+for line in benchmark.compare(baseline, results, 1.2):
+    print(line.split(':')[0])
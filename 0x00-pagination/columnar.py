@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Dictionary-encoded, array-backed columnar dataset.
+"""
+import csv
+import io
+import json
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Optional, Sequence
+
+from parallel_loader import load_end
+
+ALIGNMENT = 8
+
+
+def smallest_typecode(low: int, high: int) -> str:
+    """Picks the narrowest array typecode able to hold [low, high].
+
+    Args:
+        low (int): Smallest value to store.
+        high (int): Largest value to store.
+
+    Returns:
+        str: An array typecode.
+    """
+    for code in ('B', 'H', 'I', 'Q') if low >= 0 else ('b', 'h', 'i', 'q'):
+        bits = array(code).itemsize * 8
+        if code.isupper():
+            floor, ceiling = 0, (1 << bits) - 1
+        else:
+            floor, ceiling = -(1 << bits - 1), (1 << bits - 1) - 1
+        if floor <= low and high <= ceiling:
+            return code
+    raise OverflowError("value out of range for a 64-bit array")
+
+
+def is_canonical_int(value: str) -> bool:
+    """Tells whether value round-trips through int() unchanged."""
+    try:
+        return str(int(value)) == value
+    except ValueError:
+        return False
+
+
+class Column:
+    """A single column held as a typed array.
+
+    Categorical columns keep small integer codes into a dictionary of
+    distinct strings; numeric columns keep the values themselves and
+    have no dictionary.
+    """
+
+    def __init__(self, name: str, values: Sequence[int],
+                 dictionary: Optional[List[str]] = None):
+        """Initializes a column from its array and optional dictionary."""
+        self.name = name
+        self.values = values
+        self.dictionary = dictionary
+        self.lookup = None
+
+    def __len__(self) -> int:
+        """Returns the number of values in the column."""
+        return len(self.values)
+
+    def value(self, i: int) -> str:
+        """Decodes the value at row i back to its CSV string."""
+        if self.dictionary is None:
+            return str(self.values[i])
+        return self.dictionary[self.values[i]]
+
+    def decode(self, start: int, stop: int) -> List[str]:
+        """Decodes the values of rows [start, stop)."""
+        values = self.values[start:stop]
+        if self.dictionary is None:
+            return [str(v) for v in values]
+        dictionary = self.dictionary
+        return [dictionary[v] for v in values]
+
+
+class ColumnarDataset:
+    """Rows stored column by column, materialized only when read.
+
+    Behaves like a read-only sequence of rows, so it can stand in for
+    the list-of-lists dataset wherever pages are sliced.
+    """
+
+    def __init__(self, header: List[str], columns: List[Column]):
+        """Initializes the dataset from already encoded columns."""
+        self.header = header
+        self.columns = columns
+        self.length = len(columns[0]) if columns else 0
+
+    @classmethod
+    def from_rows(cls, header: List[str],
+                  rows: Iterable[List[str]]) -> 'ColumnarDataset':
+        """Encodes rows in a single pass without keeping them around.
+
+        Every column starts dictionary-encoded; once all rows are seen,
+        columns whose distinct values are all plain integers are
+        converted to typed numeric arrays.
+
+        Args:
+            header (List[str]): Column names.
+            rows (Iterable[List[str]]): Rows with one value per column.
+
+        Returns:
+            ColumnarDataset: The encoded dataset.
+        """
+        width = len(header)
+        lookups = [{} for _ in range(width)]
+        codes = [array('I') for _ in range(width)]
+        for row in rows:
+            if len(row) != width:
+                raise ValueError("row has {} fields, expected {}".format(
+                    len(row), width))
+            for lookup, column, value in zip(lookups, codes, row):
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(lookup)
+                column.append(code)
+
+        columns = []
+        for name, lookup, column in zip(header, lookups, codes):
+            dictionary = list(lookup)
+            if dictionary and all(is_canonical_int(v) for v in dictionary):
+                numbers = [int(v) for v in dictionary]
+                typecode = smallest_typecode(min(numbers), max(numbers))
+                values = array(typecode, (numbers[c] for c in column))
+                columns.append(Column(name, values))
+            else:
+                typecode = smallest_typecode(0, max(len(dictionary) - 1, 0))
+                columns.append(Column(name, array(typecode, column),
+                                      dictionary))
+        return cls(header, columns)
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'ColumnarDataset':
+        """Encodes the CSV file at path, using its first row as header.
+
+        A trailing row cut short inside a quoted field is left out.
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        end = load_end(data)
+        reader = csv.reader(io.StringIO(data[:end].decode('utf-8'),
+                                        newline=''))
+        header = next(reader, [])
+        return cls.from_rows(header, reader)
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return self.length
+
+    def __getitem__(self, key):
+        """Materializes a single row, or a list of rows for a slice."""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self.rows(start, stop)
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("row index out of range")
+        return [column.value(key) for column in self.columns]
+
+    def rows(self, start: int, stop: int) -> List[List]:
+        """Materializes rows in [start, stop).
+
+        Args:
+            start (int): Index of the first row.
+            stop (int): Index one past the last row.
+
+        Returns:
+            List[List]: The rows as lists of strings.
+        """
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        decoded = [column.decode(start, stop) for column in self.columns]
+        return [list(row) for row in zip(*decoded)]
+
+    def extend(self, rows: Iterable[List[str]]) -> None:
+        """Appends rows in place, in time proportional to their number.
+
+        Arrays and dictionaries only ever grow at the end, and len() is
+        bumped once every column holds the new rows, so a reader never
+        sees a partial append and the codes of existing rows keep their
+        meaning. A column only gets a new array, copied once, when it
+        is a read-only view into a snapshot, when new values or codes no
+        longer fit its typecode, or when a numeric column receives a
+        non-integer value and becomes dictionary-encoded.
+
+        Args:
+            rows (Iterable[List[str]]): Rows with one value per column.
+        """
+        rows = list(rows)
+        width = len(self.header)
+        for row in rows:
+            if len(row) != width:
+                raise ValueError("row has {} fields, expected {}".format(
+                    len(row), width))
+        if not rows:
+            return
+
+        for position, column in enumerate(self.columns):
+            added = [row[position] for row in rows]
+            if column.dictionary is None and \
+                    all(is_canonical_int(v) for v in added):
+                self.columns[position] = self.__extend_numbers(
+                    column, [int(v) for v in added])
+            else:
+                self.columns[position] = self.__extend_codes(column, added)
+        self.length += len(rows)
+
+    def __extend_numbers(self, column: Column, numbers: List[int]) -> Column:
+        """Appends integers to a numeric column, widening it if needed."""
+        values = column.values
+        typecode = values.typecode if isinstance(values, array) \
+            else values.format
+        try:
+            tail = array(typecode, numbers)
+        except OverflowError:
+            values = list(values[:self.length]) + numbers
+            return Column(column.name, array(
+                smallest_typecode(min(values), max(values)), values))
+        if not isinstance(values, array):
+            column = Column(column.name, array(typecode, values[:self.length]))
+        column.values.extend(tail)
+        return column
+
+    def __extend_codes(self, column: Column, added: List[str]) -> Column:
+        """Appends values to a column as dictionary codes.
+
+        A numeric column is dictionary-encoded first.
+        """
+        if column.dictionary is None:
+            lookup = {}
+            codes = [lookup.setdefault(str(value), len(lookup))
+                     for value in column.values[:self.length]]
+            column = Column(column.name, array('I', codes), list(lookup))
+            column.lookup = lookup
+        elif column.lookup is None:
+            column.lookup = {value: code
+                             for code, value in enumerate(column.dictionary)}
+        dictionary, lookup = column.dictionary, column.lookup
+        codes = []
+        for value in added:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(dictionary)
+                dictionary.append(value)
+            codes.append(code)
+
+        values = column.values
+        typecode = smallest_typecode(0, max(len(dictionary) - 1, 0))
+        if not isinstance(values, array) or \
+                array(typecode).itemsize > values.itemsize:
+            column = Column(column.name, array(typecode, values[:self.length]),
+                            dictionary)
+            column.lookup = lookup
+        column.values.extend(codes)
+        return column
+
+    def to_bytes(self) -> bytes:
+        """Serializes the dataset into a flat, mmap-friendly layout.
+
+        The layout is a little-endian length prefix, a JSON block
+        describing each column, then the raw column arrays, each
+        aligned to 8 bytes so they can be viewed in place.
+
+        Returns:
+            bytes: The serialized dataset.
+        """
+        descriptors = []
+        blobs = []
+        offset = 0
+        for column in self.columns:
+            raw = memoryview(column.values).cast('B')
+            descriptors.append({
+                'name': column.name,
+                'typecode': column.values.typecode if isinstance(
+                    column.values, array) else column.values.format,
+                'offset': offset,
+                'length': len(column),
+                'dictionary': column.dictionary,
+            })
+            padding = -len(raw) % ALIGNMENT
+            blobs.append(bytes(raw) + b'\0' * padding)
+            offset += len(raw) + padding
+        meta = json.dumps({
+            'header': self.header,
+            'byteorder': sys.byteorder,
+            'columns': descriptors,
+        }).encode('utf-8')
+        meta += b' ' * (-(len(meta) + 8) % ALIGNMENT)
+        return struct.pack('<Q', len(meta)) + meta + b''.join(blobs)
+
+    @classmethod
+    def from_buffer(cls, buf) -> 'ColumnarDataset':
+        """Loads a dataset serialized by to_bytes() without copying arrays.
+
+        Column values become memoryviews into buf, so a buffer backed by
+        mmap or shared memory is used in place.
+
+        Args:
+            buf: A bytes-like object holding the serialized dataset.
+
+        Returns:
+            ColumnarDataset: The dataset viewing buf.
+
+        Raises:
+            ValueError: buf is truncated or not a serialized dataset.
+        """
+        view = memoryview(buf).cast('B')
+        (meta_size,) = struct.unpack_from('<Q', view)
+        meta = json.loads(bytes(view[8:8 + meta_size]))
+        base = 8 + meta_size
+        columns = []
+        for spec in meta['columns']:
+            typecode = spec['typecode']
+            start = base + spec['offset']
+            size = spec['length'] * array(typecode).itemsize
+            if start + size > len(view):
+                raise ValueError("column {!r} is truncated".format(
+                    spec['name']))
+            values = view[start:start + size].cast(typecode)
+            if meta['byteorder'] != sys.byteorder:
+                values = array(typecode, values)
+                values.byteswap()
+            columns.append(Column(spec['name'], values, spec['dictionary']))
+        return cls(meta['header'], columns)
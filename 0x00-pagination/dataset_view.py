@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""A dataset together with the indexes built over it.
+"""
+import csv
+import io
+import mmap
+import os
+from bisect import bisect_left
+from typing import (Dict, Iterator, List, NamedTuple, Optional, Sequence,
+                    Tuple)
+
+from columnar import ColumnarDataset
+from parallel_loader import last_row_end, load_end
+from posting_index import PostingIndex
+from prefix_index import PrefixIndex
+from sort_index import SortIndex, parse_order
+
+FINGERPRINT_BYTES = 4096
+
+
+class FileMark(NamedTuple):
+    """Where a view stopped reading its CSV file, and how to recognize it.
+
+    A final row missing its newline is served but not trusted: offset is
+    where it starts and pending its length, so the next append re-reads
+    it.
+    """
+    offset: int
+    identity: Tuple[int, int]
+    head: bytes
+    tail: bytes
+    pending: int = 0
+
+
+def complete_rows_end(buf, rows: int = None) -> Tuple[int, int]:
+    """Finds the end of the last complete row in buf.
+
+    Args:
+        buf: A bytes-like object or mmap of CSV data starting on a row
+            boundary.
+        rows (int): Stop after this many rows, or None for all of them.
+
+    Returns:
+        Tuple[int, int]: The offset just past the last complete row, and
+            the number of rows before it.
+    """
+    end, count, pos, quotes = 0, 0, 0, 0
+    while rows is None or count < rows:
+        newline = buf.find(b'\n', pos)
+        if newline == -1:
+            break
+        if buf.find(b'"', pos, newline) != -1:
+            quotes += buf[pos:newline].count(b'"')
+        pos = newline + 1
+        if quotes % 2 == 0:
+            end, count = pos, count + 1
+    return end, count
+
+
+UNKNOWN_MARK = FileMark(0, (-1, -1), b'', b'')
+
+
+def mark_buffer(buf, offset: int, identity: Tuple[int, int],
+                pending: int = 0) -> FileMark:
+    """Records the bytes around offset of a file already read into buf."""
+    return FileMark(offset, identity,
+                    bytes(buf[:min(offset, FINGERPRINT_BYTES)]),
+                    bytes(buf[max(offset - FINGERPRINT_BYTES, 0):offset]),
+                    pending)
+
+
+def read_complete(path: str) -> Tuple[Iterator[List[str]], FileMark]:
+    """Reads the rows of the CSV file at path in one go.
+
+    A trailing row cut short inside a quoted field is left out, and the
+    mark describes exactly the bytes the rows come from, so a later
+    appended() cannot mistake a file replaced meanwhile for an append.
+
+    Returns:
+        Tuple[Iterator[List[str]], FileMark]: A reader over the rows,
+            header included, and where they end.
+    """
+    with open(path, 'rb') as file:
+        stat = os.fstat(file.fileno())
+        data = file.read()
+    end = last_row_end(data)
+    stop = load_end(data, end)
+    mark = mark_buffer(data, end, (stat.st_dev, stat.st_ino), stop - end)
+    if stop < len(data):
+        data = data[:stop]
+    return csv.reader(io.StringIO(data.decode('utf-8'), newline='')), mark
+
+
+def mark_file(path: str, offset: int) -> FileMark:
+    """Records the identity and the bytes around offset of the file at path."""
+    with open(path, 'rb') as file:
+        stat = os.fstat(file.fileno())
+        head = file.read(min(offset, FINGERPRINT_BYTES))
+        file.seek(max(offset - FINGERPRINT_BYTES, 0))
+        tail = file.read(min(offset, FINGERPRINT_BYTES))
+    return FileMark(offset, (stat.st_dev, stat.st_ino), head, tail)
+
+
+class DatasetView:
+    """Rows plus lazily built indexes, replaced as one unit.
+
+    A Server swaps its whole view when the data changes, so a request
+    that grabbed a view keeps seeing rows and indexes that agree. Rows
+    appended to the file are appended to the storage in place, which
+    older views then share: existing rows never change, and each view
+    only reads the first length rows, so it stays a snapshot.
+
+    Attributes:
+        rows (Sequence[List]): The row storage, possibly longer than the
+            view.
+        length (int): The number of rows in the view.
+        header (List[str]): The column names.
+        generation (int): Bumped every time the data changes.
+        mark (FileMark): Where the rows end in the CSV file, if known.
+    """
+
+    def __init__(self, rows: Sequence[List], header: List[str],
+                 generation: int = 0, mark: FileMark = None,
+                 postings: PostingIndex = None, length: int = None):
+        """Initializes a view over the first length rows, or all of them."""
+        self.rows = rows
+        self.length = len(rows) if length is None else length
+        self.header = header
+        self.generation = generation
+        self.mark = mark
+        self.__postings = postings
+        self.__sort_index = None
+        self.__prefix_indexes = {}
+
+    def select(self, filters: Dict[str, str] = None,
+               order_by: str = None) -> Optional[Sequence[int]]:
+        """Resolves filters and ordering to the ids of the rows to page.
+
+        Args:
+            filters (Dict[str, str]): Column names mapped to the value each
+                must equal, e.g. {"Gender": "FEMALE", "Year of Birth": "2016"}.
+            order_by (str): A column name optionally followed by "asc" or
+                "desc", e.g. "Count desc". Integer columns sort numerically.
+
+        Returns:
+            Optional[Sequence[int]]: The ids of the selected rows in page
+                order, or None when there are neither filters nor ordering.
+        """
+        if not filters and not order_by:
+            return None
+        header = self.header
+        for name in filters or ():
+            assert name in header, "Unknown filter column: {}".format(name)
+
+        row_ids = None
+        if filters:
+            if self.__postings is None:
+                self.__postings = PostingIndex(self.rows, self.length)
+            matched = {header.index(name): str(value)
+                       for name, value in filters.items()}
+            row_ids = self.__postings.match(matched)
+            if row_ids and row_ids[-1] >= self.length:
+                # Lists shared with newer views hold their rows too
+                row_ids = row_ids[:bisect_left(row_ids, self.length)]
+        if not order_by:
+            return row_ids
+
+        name, descending = parse_order(order_by)
+        assert name in header, "Unknown order_by column: {}".format(name)
+        if self.__sort_index is None:
+            self.__sort_index = SortIndex(self.rows, self.length)
+        if row_ids is None:
+            return self.__sort_index.permutation(header.index(name),
+                                                 descending)
+
+        return self.__sort_index.order(
+            row_ids, header.index(name), descending,
+            cache_key=tuple(sorted(matched.items())))
+
+    def prefix_index(self, name: str) -> PrefixIndex:
+        """Returns the prefix index over the named column, building it once."""
+        if name not in self.__prefix_indexes:
+            self.__prefix_indexes[name] = PrefixIndex(
+                self.rows, self.header.index(name), self.length)
+
+        return self.__prefix_indexes[name]
+
+    def marked(self, path: str) -> FileMark:
+        """Locates where the rows of this view end in the CSV at path.
+
+        Only needed for views whose loader could not mark the bytes it
+        read, such as a shared dataset; the rows are counted again from
+        the top of the file once.
+        """
+        if self.mark is None:
+            with open(path, 'rb') as file, mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                offset, count = complete_rows_end(buf, self.length + 1)
+                # One row short: the last row served has no newline
+                pending = len(buf) - offset if count == self.length else 0
+            self.mark = mark_file(path, offset)._replace(pending=pending)
+
+        return self.mark
+
+    def appended(self, path: str) -> Optional['DatasetView']:
+        """Returns a view extended with the rows appended to path.
+
+        Only newline-terminated rows are taken; a row still being
+        written is left for the next call. A last row that was served
+        without its newline is read again and must come back unchanged.
+        The rows and built posting lists grow in place, so the cost is
+        proportional to the appended rows.
+
+        Args:
+            path (str): The CSV file this view was loaded from.
+
+        Returns:
+            Optional[DatasetView]: The extended view, this view if nothing
+                complete was appended, or None if the file was truncated
+                or rewritten, or the storage cannot be extended in place,
+                e.g. because it already grew past this view.
+        """
+        mark = self.marked(path)
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            if (stat.st_dev, stat.st_ino) != mark.identity or \
+                    stat.st_size < mark.offset:
+                return None
+            head = file.read(len(mark.head))
+            file.seek(mark.offset - len(mark.tail))
+            tail = file.read(len(mark.tail))
+            if head != mark.head or tail != mark.tail:
+                return None
+            appended = file.read()
+
+        if mark.pending and len(appended) == mark.pending:
+            return self
+        end, count = complete_rows_end(appended)
+        if count == 0:
+            # A pending row that grew without its newline was cut short
+            return None if mark.pending else self
+        if not isinstance(self.rows, (list, ColumnarDataset)) or \
+                len(self.rows) != self.length:
+            return None
+        rows = list(csv.reader(
+            io.StringIO(appended[:end].decode('utf-8'), newline='')))
+        if mark.pending:
+            if rows[0] != self.rows[self.length - 1]:
+                return None
+            rows = rows[1:]
+
+        added = appended[:end]
+        fresh = FileMark(mark.offset + end, mark.identity,
+                         (mark.head + added)[:FINGERPRINT_BYTES],
+                         (mark.tail + added)[-FINGERPRINT_BYTES:])
+        if not rows:
+            self.mark = fresh  # The pending row got its newline
+            return self
+        length = self.length + len(rows)
+        self.rows.extend(rows)
+        postings = self.__postings
+        if postings is not None:
+            postings = postings.extended(self.rows, self.length, length)
+        return DatasetView(self.rows, self.header, self.generation + 1, fresh,
+                           postings, length)
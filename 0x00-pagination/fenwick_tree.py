@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Fenwick (binary indexed) tree over non-negative integer counts.
+"""
+from array import array
+from typing import Iterable
+
+
+class FenwickTree:
+    """Prefix sums and rank selection over a growable array of counts.
+
+    Every operation runs in O(log n).
+    """
+
+    def __init__(self, counts: Iterable[int] = ()):
+        """Builds the tree over counts in O(n)."""
+        self.__tree = array('q', [0])
+        self.__tree.extend(counts)
+        size = len(self.__tree) - 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                self.__tree[parent] += self.__tree[i]
+
+    def __len__(self) -> int:
+        """Returns the number of counts tracked."""
+        return len(self.__tree) - 1
+
+    def add(self, index: int, delta: int) -> None:
+        """Adds delta to the count at index.
+
+        Args:
+            index (int): 0-based position of the count.
+            delta (int): Amount to add, may be negative.
+        """
+        i = index + 1
+        size = len(self.__tree)
+        while i < size:
+            self.__tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, index: int) -> int:
+        """Returns the sum of the counts before index.
+
+        Args:
+            index (int): 0-based position, clamped to the tree size.
+
+        Returns:
+            int: The sum of counts in [0, index).
+        """
+        i = min(index, len(self))
+        total = 0
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def total(self) -> int:
+        """Returns the sum of all counts."""
+        return self.prefix_sum(len(self))
+
+    def append(self, count: int) -> None:
+        """Appends a new count at the end of the tree.
+
+        Args:
+            count (int): The count to append.
+        """
+        i = len(self.__tree)
+        self.__tree.append(
+            count + self.prefix_sum(i - 1) - self.prefix_sum(i - (i & -i)))
+
+    def find(self, rank: int) -> int:
+        """Finds the position holding the rank-th unit of count.
+
+        Args:
+            rank (int): 1-based rank, between 1 and total().
+
+        Returns:
+            int: The smallest index whose prefix sum through it reaches
+                rank, or len(self) if rank exceeds total().
+        """
+        position = 0
+        step = 1 << len(self).bit_length()
+        while step:
+            following = position + step
+            if following <= len(self) and self.__tree[following] < rank:
+                position = following
+                rank -= self.__tree[following]
+            step >>= 1
+        return position
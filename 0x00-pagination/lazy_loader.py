@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Thread-safe, single-flight lazy loading.
+"""
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class LazyLoader(Generic[T]):
+    """Runs a loader at most once, however many threads ask for its value.
+
+    The first caller runs the loader while the others block on a lock
+    and then reuse its result. A loader that raises leaves nothing
+    behind, so the next caller tries again; until then, wait() raises
+    the failure instead of blocking for a value that is not coming.
+    Waiting while no load is running starts one.
+    """
+
+    def __init__(self, load: Callable[[], T]):
+        """Wraps load, which is not called until the value is needed."""
+        self.__load = load
+        self.__lock = threading.Lock()
+        self.__ready = threading.Event()
+        self.__done = threading.Event()  # No load in flight
+        self.__done.set()
+        self.__error = None
+        self.__value = None
+
+    def get(self) -> T:
+        """Returns the value, loading it on the first call.
+
+        Raises:
+            Exception: Whatever the loader raised; the next call retries.
+        """
+        if not self.__ready.is_set():
+            with self.__lock:
+                if not self.__ready.is_set():
+                    self.__done.clear()
+                    try:
+                        self.__value = self.__load()
+                    except BaseException as error:
+                        self.__error = error
+                        self.__done.set()
+                        raise
+                    self.__error = None
+                    self.__ready.set()
+                    self.__done.set()
+
+        return self.__value
+
+    def set(self, value: T) -> None:
+        """Replaces the value, e.g. after a reload."""
+        self.__value = value
+        self.__error = None
+        self.__ready.set()
+        self.__done.set()
+
+    def start(self) -> threading.Thread:
+        """Starts loading on a daemon thread without waiting for it.
+
+        Returns:
+            threading.Thread: The loading thread.
+        """
+        def warm():
+            try:
+                self.get()
+            except Exception:
+                pass  # Kept for wait(); the next get() retries
+            finally:
+                self.__done.set()
+
+        if not self.__ready.is_set():
+            self.__done.clear()  # In flight from now, not once it runs
+        thread = threading.Thread(target=warm, daemon=True)
+        thread.start()
+        return thread
+
+    def ready(self) -> bool:
+        """Tells whether the value has been loaded."""
+        return self.__ready.is_set()
+
+    def error(self) -> Optional[BaseException]:
+        """Returns why the last load failed, or None."""
+        return self.__error
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the value is loaded or timeout seconds pass.
+
+        A load is started if none has run yet, so this never waits on
+        a value that nobody is loading.
+
+        Returns:
+            bool: True if the value is loaded.
+
+        Raises:
+            Exception: What the last load raised, if it failed.
+        """
+        if (not self.__ready.is_set() and self.__done.is_set()
+                and self.__error is None):
+            self.start()
+        self.__done.wait(timeout)
+        if self.__error is not None and not self.__ready.is_set():
+            raise self.__error
+        return self.__ready.is_set()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+PageView = __import__('page_view').PageView
+Server = __import__('2-hypermedia_pagination').Server
+Server.DATA_FILE = "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"
+
+# A page is a window over the rows, not a copy of them
+rows = [[str(i), "Name {}".format(i)] for i in range(10)]
+page = PageView(rows, 2, 5)
+print(len(page), page[0] is rows[2], page[-1], page)
+print(page[1:], page[::2], page == rows[2:5], page == rows[2:4])
+
+# Row ids pick rows in their own order, and windows clamp to them
+page = PageView(rows, 1, 10, [9, 7, 5])
+print(list(page), len(page))
+try:
+    page[2]
+except IndexError as error:
+    print("IndexError:", error)
+
+# Many pages are resolved against one view in a single pass
+server = Server()
+pages = server.get_pages([(1, 2), (3, 2), (9709, 2), (9710, 2)])
+for result in pages:
+    print(result['page'], result['page_size'], result['next_page'],
+          result['prev_page'], result['total_pages'])
+print(pages[1]['data'] == server.get_hyper(3, 2)['data'])
+
+# Filters and ordering are shared by the whole batch
+pages = server.get_pages([(1, 3), (2, 3)], {'Ethnicity': 'HISPANIC'},
+                         'Count desc')
+for result in pages:
+    print(result['total_pages'], list(result['data']))
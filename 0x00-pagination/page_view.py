@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Read-only page views over shared row storage.
+"""
+from collections.abc import Sequence as SequenceABC
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence
+
+
+class PageView(SequenceABC):
+    """A window of rows that reads through to the storage on access.
+
+    Creating a view copies nothing: a page over a list dataset hands out
+    the stored row objects themselves, and a page over columnar or mmap
+    storage decodes rows only when they are read. Callers must not
+    mutate the rows they get back.
+    """
+
+    __slots__ = ('__rows', '__row_ids', '__start', '__stop')
+
+    def __init__(self, rows: Sequence[List], start: int, stop: int,
+                 row_ids: Optional[Sequence[int]] = None):
+        """Views positions [start, stop) of row_ids, or of rows if None."""
+        size = len(rows if row_ids is None else row_ids)
+        self.__rows = rows
+        self.__row_ids = row_ids
+        self.__start = min(start, size)
+        self.__stop = min(max(stop, start), size)
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the page."""
+        return self.__stop - self.__start
+
+    def __getitem__(self, key):
+        """Returns one row, or a narrower PageView for a slice."""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return PageView(self.__rows, self.__start + start,
+                            self.__start + stop, self.__row_ids)
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("page index out of range")
+        position = self.__start + key
+        if self.__row_ids is not None:
+            position = self.__row_ids[position]
+        return self.__rows[position]
+
+    def __iter__(self) -> Iterator[List]:
+        """Yields the rows of the page in order."""
+        if self.__row_ids is not None:
+            rows = self.__rows
+            for row_id in self.__row_ids[self.__start:self.__stop]:
+                yield rows[row_id]
+        elif isinstance(self.__rows, list):
+            yield from islice(self.__rows, self.__start, self.__stop)
+        else:
+            yield from self.__rows[self.__start:self.__stop]
+
+    def __eq__(self, other) -> bool:
+        """Compares row by row with any sequence of rows."""
+        if not isinstance(other, SequenceABC) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and \
+            all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        """Shows the rows of the page."""
+        return "PageView({!r})".format(list(self))
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+
+parallel_loader = __import__('parallel_loader')
+load_rows = parallel_loader.load_rows
+chunk_ranges = parallel_loader.chunk_ranges
+Server = __import__('2-hypermedia_pagination').Server
+Server.DATA_FILE = "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"
+
+if __name__ == "__main__":
+    # Forcing the process pool on gives the same rows as a serial parse
+    rows = load_rows(Server.DATA_FILE, workers=4, min_parallel_bytes=0)
+    print(len(rows), rows == Server().dataset())
+
+    # Quoted newlines and commas never split a row across chunks
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "names.csv")
+    with open(path, "w") as file:
+        file.write('id,name\n')
+        for i in range(200):
+            file.write('{},"Name\n{}, Jr."\n'.format(i, i))
+    print(len(chunk_ranges(path, 16)) > 1)
+    rows = load_rows(path, workers=4, min_parallel_bytes=0)
+    print(len(rows), rows[0], rows[-1])
+    print(rows == load_rows(path, workers=1))
+
+    # end stops the parse before a row that is still being written
+    end = os.path.getsize(path)
+    with open(path, "a") as file:
+        file.write('200,"Na')
+    print(len(load_rows(path, workers=4, min_parallel_bytes=0, end=end)))
+    shutil.rmtree(directory)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Parallel CSV parsing over newline-aligned byte ranges.
+"""
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+MIN_PARALLEL_BYTES = 32 << 20
+COUNT_BLOCK = 64 << 20
+
+
+def count_quotes(buf, start: int, end: int) -> int:
+    """Counts quote characters in buf[start:end] a block at a time."""
+    total = 0
+    for block in range(start, end, COUNT_BLOCK):
+        total += buf[block:min(block + COUNT_BLOCK, end)].count(b'"')
+    return total
+
+
+def next_row_start(buf, pos: int, quotes: int) -> int:
+    """Finds the first row boundary at or after pos.
+
+    Args:
+        buf: A bytes-like object or mmap holding CSV data.
+        pos (int): Offset to start searching from.
+        quotes (int): Quote characters seen since the last known row start.
+
+    Returns:
+        int: The offset just after the first newline outside quotes,
+            or len(buf) if there is none.
+    """
+    while True:
+        newline = buf.find(b'\n', pos)
+        if newline == -1:
+            return len(buf)
+        quotes += count_quotes(buf, pos, newline)
+        pos = newline + 1
+        if quotes % 2 == 0:
+            return pos
+
+
+def last_row_end(buf) -> int:
+    """Finds the offset just past the last complete row in buf.
+
+    The last newline ends a row unless it sits inside a quoted field of
+    a row still being written, which an odd number of quotes before it
+    gives away.
+
+    Args:
+        buf: A bytes-like object or mmap holding CSV data from a row
+            boundary on.
+
+    Returns:
+        int: The end of the last newline-terminated row, 0 if none is.
+    """
+    end = buf.rfind(b'\n') + 1
+    quotes = count_quotes(buf, 0, end) if buf.find(b'"', 0, end) != -1 else 0
+    while quotes % 2 and end:
+        start = buf.rfind(b'\n', 0, end - 1) + 1
+        quotes -= count_quotes(buf, start, end)
+        end = start
+    return end
+
+
+def load_end(buf, end: int = None) -> int:
+    """Finds where a full load of buf stops reading.
+
+    That is past the last newline-terminated row, plus a final row
+    missing its newline if its quotes balance: a file need not end with
+    a newline, and only an odd quote count shows a row is cut short.
+
+    Args:
+        buf: A bytes-like object or mmap holding CSV data from a row
+            boundary on.
+        end (int): last_row_end(buf), if already known.
+
+    Returns:
+        int: The offset to parse up to.
+    """
+    if end is None:
+        end = last_row_end(buf)
+    if end < len(buf) and count_quotes(buf, end, len(buf)) % 2 == 0:
+        return len(buf)
+    return end
+
+
+def chunk_ranges(path: str, chunks: int,
+                 end: int = None) -> List[Tuple[int, int]]:
+    """Splits the data rows of a CSV file into byte ranges.
+
+    Each range starts and ends on a row boundary, so no row, not even one
+    with newlines inside a quoted field, is split between two ranges.
+
+    Args:
+        path (str): Path to the CSV file.
+        chunks (int): The number of ranges wanted.
+        end (int): Offset to stop at, defaults to the end of the file.
+
+    Returns:
+        List[Tuple[int, int]]: Non-empty (start, end) ranges in file
+            order, covering everything after the header row.
+    """
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        size = len(buf) if end is None else min(end, len(buf))
+        start = next_row_start(buf, 0, 0)  # Skip header
+        bounds = [start]
+        step = max((size - start) // max(chunks, 1), 1)
+        for target in range(start + step, size, step):
+            if target <= bounds[-1]:
+                continue
+            quotes = count_quotes(buf, bounds[-1], target)
+            bounds.append(next_row_start(buf, target, quotes))
+        bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+def parse_range(path: str, start: int, end: int) -> List[List]:
+    """Parses the rows stored in bytes [start, end) of a CSV file."""
+    with open(path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    return list(csv.reader(io.StringIO(text, newline='')))
+
+
+def load_rows(path: str, workers: int = None,
+              min_parallel_bytes: int = MIN_PARALLEL_BYTES,
+              end: int = None) -> List[List]:
+    """Parses the data rows of a CSV file across a process pool.
+
+    Files smaller than min_parallel_bytes are parsed serially, since
+    starting workers would cost more than it saves.
+
+    Args:
+        path (str): Path to the CSV file.
+        workers (int): Worker processes, defaults to the CPU count.
+        min_parallel_bytes (int): Size below which parsing stays serial.
+        end (int): Offset to stop at, defaults to the end of the file.
+
+    Returns:
+        List[List]: The rows in file order, excluding the header row.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path) if end is None else end
+    if workers == 1 or size < min_parallel_bytes:
+        rows = parse_range(path, 0, size)
+        return rows[1:]  # Skip header
+
+    ranges = chunk_ranges(path, workers * 4, end)
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(parse_range, [path] * len(ranges),
+                              *zip(*ranges)):
+            rows.extend(chunk)
+    return rows
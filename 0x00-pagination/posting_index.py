@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Posting-list secondary indexes for filtered pagination.
+"""
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, List, Sequence
+
+from columnar import ColumnarDataset
+
+MAX_CACHED_MATCHES = 128
+EMPTY = array('I')
+
+
+def intersect(postings: List[Sequence[int]]) -> array:
+    """Intersects sorted row-id arrays.
+
+    The shortest list drives the intersection and every other list is
+    probed with a binary search that only moves forward, so the cost is
+    O(m log n) for a shortest list of length m.
+
+    Args:
+        postings (List[Sequence[int]]): Sorted arrays of row ids.
+
+    Returns:
+        array: The row ids present in every list, in ascending order.
+    """
+    postings = sorted(postings, key=len)
+    result = array('I', postings[0])
+    for other in postings[1:]:
+        kept = array('I')
+        low = 0
+        for row_id in result:
+            low = bisect_left(other, row_id, low)
+            if low == len(other):
+                break
+            if other[low] == row_id:
+                kept.append(row_id)
+        result = kept
+    return result
+
+
+class PostingIndex:
+    """Per-column posting lists mapping each value to its sorted row ids.
+
+    A column's lists are built the first time that column is filtered
+    on, and the matches of recent filter combinations are cached.
+    """
+
+    def __init__(self, rows: Sequence[List], length: int = None):
+        """Initializes an empty index over the first length rows, or all."""
+        self.__rows = rows
+        self.__length = len(rows) if length is None else length
+        self.__postings = {}
+        self.__matches = OrderedDict()
+
+    def postings(self, column: int) -> Dict[str, array]:
+        """Returns the posting lists of a column, building them if needed.
+
+        Args:
+            column (int): The position of the column.
+
+        Returns:
+            Dict[str, array]: Each value mapped to its ascending row ids.
+        """
+        if column not in self.__postings:
+            self.__postings[column] = self.__build(column)
+
+        return self.__postings[column]
+
+    def __build(self, column: int) -> Dict[str, array]:
+        """Groups row ids by the value they hold in column."""
+        rows = self.__rows
+        count = self.__length
+        if isinstance(rows, ColumnarDataset):
+            encoded = rows.columns[column]
+            values = islice(encoded.values, count)
+            if encoded.dictionary is not None:
+                lists = [array('I') for _ in encoded.dictionary]
+                for row_id, code in enumerate(values):
+                    lists[code].append(row_id)
+                return dict(zip(encoded.dictionary, lists))
+            groups = {}
+            for row_id, value in enumerate(values):
+                groups.setdefault(value, array('I')).append(row_id)
+            return {str(value): ids for value, ids in groups.items()}
+
+        groups = {}
+        for row_id in range(count):
+            groups.setdefault(rows[row_id][column], array('I')).append(row_id)
+        return groups
+
+    def extended(self, rows: Sequence[List], start: int,
+                 length: int) -> 'PostingIndex':
+        """Returns an index over rows, whose ids in [start, length) are new.
+
+        The new ids are appended to the posting lists already built, in
+        place, which keeps them sorted and costs time proportional to
+        the new rows only. The lists are shared with this index, which
+        serves the same, grown row storage and must ignore ids past its
+        own length; only the cached matches are left behind.
+
+        Args:
+            rows (Sequence[List]): The extended row storage.
+            start (int): The id of the first new row.
+            length (int): The number of rows the new index covers.
+
+        Returns:
+            PostingIndex: The index over rows.
+        """
+        index = PostingIndex(rows, length)
+        added = rows[start:length]
+        for column, postings in self.__postings.items():
+            for row_id, row in enumerate(added, start):
+                value = row[column]
+                ids = postings.get(value)
+                if ids is None:
+                    ids = postings[value] = array('I')
+                ids.append(row_id)
+            index.__postings[column] = postings
+        return index
+
+    def match(self, filters: Dict[int, str]) -> Sequence[int]:
+        """Returns the ascending ids of the rows matching every filter.
+
+        A single filter returns its posting list as is; combinations are
+        intersected once and cached.
+
+        Args:
+            filters (Dict[int, str]): Column positions mapped to the value
+                each must equal.
+
+        Returns:
+            Sequence[int]: The matching row ids.
+        """
+        key = tuple(sorted(filters.items()))
+        if key in self.__matches:
+            self.__matches.move_to_end(key)
+            return self.__matches[key]
+
+        postings = [self.postings(column).get(value, EMPTY)
+                    for column, value in key]
+        if len(postings) == 1:
+            return postings[0]
+        result = intersect(postings)
+        self.__matches[key] = result
+        if len(self.__matches) > MAX_CACHED_MATCHES:
+            self.__matches.popitem(last=False)
+        return result
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Sorted-array prefix index over a text column.
+"""
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from typing import List, Sequence, Tuple
+
+from columnar import ColumnarDataset
+
+MAX_CHAR = chr(0x10FFFF)
+
+
+class PrefixIndex:
+    """Row ids ordered by the case-folded value of one column.
+
+    Rows sharing a prefix form one contiguous run of the ordered ids,
+    so a lookup is two binary searches over the distinct values and a
+    page of matches is a slice of that run.
+    """
+
+    def __init__(self, rows: Sequence[List], column: int,
+                 length: int = None):
+        """Builds the index over column of the first length rows, or all."""
+        count = len(rows) if length is None else length
+        if isinstance(rows, ColumnarDataset) and \
+                rows.columns[column].dictionary is not None:
+            encoded = rows.columns[column]
+            keys = [value.casefold() for value in encoded.dictionary]
+            row_keys = [keys[code] for code in islice(encoded.values, count)]
+        else:
+            row_keys = [rows[row_id][column].casefold()
+                        for row_id in range(count)]
+
+        self.__row_ids = array('I', sorted(range(len(row_keys)),
+                                           key=row_keys.__getitem__))
+        self.__keys = []
+        self.__starts = array('I')
+        for position, row_id in enumerate(self.__row_ids):
+            key = row_keys[row_id]
+            if not self.__keys or self.__keys[-1] != key:
+                self.__keys.append(key)
+                self.__starts.append(position)
+        self.__starts.append(len(self.__row_ids))
+
+    def match_range(self, prefix: str) -> Tuple[int, int]:
+        """Locates the run of rows whose value starts with prefix.
+
+        Args:
+            prefix (str): The prefix to look up, matched case-insensitively.
+
+        Returns:
+            Tuple[int, int]: The [start, end) positions of the run within
+                the ordered row ids.
+        """
+        prefix = prefix.casefold()
+        low = bisect_left(self.__keys, prefix)
+        high = bisect_left(self.__keys, prefix + MAX_CHAR, low)
+        return self.__starts[low], self.__starts[high]
+
+    def row_ids(self, start: int, end: int) -> array:
+        """Returns the ordered row ids at positions [start, end)."""
+        return self.__row_ids[start:end]
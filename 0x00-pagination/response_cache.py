@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Bounded hypermedia response cache built on the 0x01-caching policies.
+"""
+import os
+import sys
+import threading
+from typing import Dict, Hashable, Optional
+
+CACHING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           os.pardir, '0x01-caching')
+if CACHING_DIR not in sys.path:
+    sys.path.append(CACHING_DIR)
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class ResponseCache:
+    """Memoizes responses per key, tagged with the dataset generation.
+
+    An entry made under an older generation is treated as a miss, so
+    a dataset reload invalidates every cached response at once without
+    walking the cache.
+
+    The policies are not thread-safe, so every access holds a lock.
+    Pages are stored as tuples of tuples and handed out as fresh lists,
+    so a caller editing a response cannot corrupt the cached one.
+    """
+
+    def __init__(self, maxsize: int = 128, policy: type = LRUCache):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize (int): The most responses kept at once.
+            policy (type): A BaseCaching subclass choosing what to evict.
+        """
+        self.__store = policy(max_items=maxsize)
+        self.__lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, generation: int) -> Optional[Dict]:
+        """Returns a copy of the response cached for key under generation,
+        if any.
+        """
+        with self.__lock:
+            entry = self.__store.get(key)
+            if entry is None or entry[0] != generation:
+                self.misses += 1
+                return None
+            self.hits += 1
+        response = entry[1]
+        return dict(response, data=[list(row) for row in response['data']])
+
+    def put(self, key: Hashable, generation: int, response: Dict) -> None:
+        """Caches a frozen copy of response for key under generation."""
+        frozen = dict(response,
+                      data=tuple(tuple(row) for row in response['data']))
+        with self.__lock:
+            self.__store.put(key, (generation, frozen))
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and eviction counters and the size."""
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.__store.evictions,
+                'size': len(self.__store.cache_data),
+                'maxsize': self.maxsize,
+            }
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Byte-offset row index over a memory-mapped CSV file.
+"""
+import csv
+import io
+import mmap
+import os
+from array import array
+from typing import List
+
+from parallel_loader import last_row_end, load_end
+
+
+def row_offsets(buf, start: int = 0, end: int = None) -> array:
+    """Collects the byte offset at which every row in buf[start:end] begins.
+
+    A newline inside a quoted field does not end a row, so the number of
+    quote characters seen so far must be even for a newline to count.
+
+    Args:
+        buf: A bytes-like object or mmap holding CSV data.
+        start (int): Offset of the first row to index.
+        end (int): Offset to stop scanning at, defaults to len(buf).
+
+    Returns:
+        array: Row start offsets followed by one trailing end offset.
+    """
+    end = len(buf) if end is None else end
+    offsets = array('Q')
+    pos = start
+    while pos < end:
+        offsets.append(pos)
+        cursor = pos
+        quotes = 0
+        while True:
+            newline = buf.find(b'\n', cursor, end)
+            if newline == -1:
+                pos = end
+                break
+            if buf.find(b'"', cursor, newline) != -1:
+                quotes += buf[cursor:newline].count(b'"')
+            cursor = newline + 1
+            if quotes % 2 == 0:
+                pos = cursor
+                break
+    offsets.append(end)
+    return offsets
+
+
+class RowIndex:
+    """Serves CSV rows straight from a memory-mapped file.
+
+    Only an array of row start offsets is kept in memory; rows are
+    decoded on access, so a page costs the same regardless of where
+    it sits in the file.
+    """
+
+    def __init__(self, path: str, skip_header: bool = True):
+        """Maps the file at path and indexes its rows.
+
+        A final row missing its newline is indexed unless it is cut short
+        inside a quoted field. self.end is where the newline-terminated
+        rows end and self.stop where the indexed ones do.
+        """
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (stat.st_dev, stat.st_ino)
+        self.end = last_row_end(self.__mmap)
+        self.stop = load_end(self.__mmap, self.end)
+        self.__offsets = row_offsets(self.__mmap, 0, self.stop)
+        if skip_header and len(self.__offsets) > 1:
+            self.__offsets = self.__offsets[1:]
+
+    def __len__(self) -> int:
+        """Returns the number of data rows."""
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, key):
+        """Decodes a single row, or a list of rows for a slice."""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self.rows(start, stop)
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("row index out of range")
+        return self.rows(key, key + 1)[0]
+
+    def rows(self, start: int, stop: int) -> List[List]:
+        """Decodes rows in [start, stop) with a single read of the mapping.
+
+        Args:
+            start (int): Index of the first row.
+            stop (int): Index one past the last row.
+
+        Returns:
+            List[List]: The decoded rows.
+        """
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        chunk = self.__mmap[self.__offsets[start]:self.__offsets[stop]]
+        return list(csv.reader(io.StringIO(chunk.decode('utf-8'), newline='')))
+
+    @property
+    def buffer(self) -> mmap.mmap:
+        """The mapped file, indexed rows ending at self.stop."""
+        return self.__mmap
+
+    def close(self) -> None:
+        """Releases the memory mapping."""
+        self.__mmap.close()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+from multiprocessing import Pool
+
+SharedDataset = __import__('shared_dataset').SharedDataset
+Server = __import__('2-hypermedia_pagination').Server
+Server.DATA_FILE = "7d3576d97e7560ae85135cc214ffe2b3412c51d7.csv"
+
+
+def worker_page(name):
+    """Attaches to the published dataset and serves a page from it."""
+    page = Server(shared_name=name).get_hyper(2, 2)
+    return page['data'], page['total_pages']
+
+
+if __name__ == "__main__":
+    # Publish once, then every worker maps the same pages read-only
+    shared = SharedDataset.publish(Server.DATA_FILE)
+    print(os.path.exists(SharedDataset.path(shared.name)))
+
+    attached = SharedDataset.attach(shared.name)
+    print(len(attached.dataset) == len(Server().dataset()))
+    print(attached.dataset[0] == Server().dataset()[0])
+
+    with Pool(2) as pool:
+        pages = pool.map(worker_page, [shared.name] * 2)
+    print(pages[0] == pages[1], pages[0])
+
+    # Shared servers never reload, and only the publisher may unlink
+    server = Server(shared_name=shared.name)
+    print(server.get_hyper(1, 1)['data'], server.refresh())
+    try:
+        attached.unlink()
+    except AssertionError as error:
+        print("AssertionError:", error)
+    shared.unlink()
+    print(os.path.exists(SharedDataset.path(shared.name)))
+    print(server.get_hyper(1, 1)['data'])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Columnar dataset published once in shared memory for many processes.
+"""
+import mmap
+import os
+import tempfile
+import uuid
+
+from columnar import ColumnarDataset
+from snapshot import load_dataset
+
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedDataset:
+    """A serialized ColumnarDataset in a memory-backed file shared by mmap.
+
+    A loader process publishes the dataset before starting workers; each
+    worker attaches by name and maps the file read-only. Every mapping
+    shares the same physical pages, so the column arrays exist once per
+    host however many workers run.
+    """
+
+    def __init__(self, name: str, owner: bool):
+        """Maps the published dataset called name."""
+        self.name = name
+        self.__owner = owner
+        with open(self.path(name), 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.dataset = ColumnarDataset.from_buffer(mapping)
+
+    @staticmethod
+    def path(name: str) -> str:
+        """Returns the file backing the dataset published as name."""
+        return os.path.join(SHM_DIR, name)
+
+    @classmethod
+    def publish(cls, csv_path: str, name: str = None) -> 'SharedDataset':
+        """Loads csv_path and publishes its dataset under name.
+
+        Args:
+            csv_path (str): Path to the CSV file.
+            name (str): Name to publish under, random if None.
+
+        Returns:
+            SharedDataset: The owning handle; call unlink() when done.
+        """
+        name = name or "pagination-{}".format(uuid.uuid4().hex)
+        path = cls.path(name)
+        temporary = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary, 'wb') as file:
+            file.write(load_dataset(csv_path).to_bytes())
+        os.replace(temporary, path)
+        return cls(name, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedDataset':
+        """Attaches read-only to a dataset published under name.
+
+        Args:
+            name (str): The name given to publish().
+
+        Returns:
+            SharedDataset: A non-owning handle.
+        """
+        return cls(name, owner=False)
+
+    def unlink(self) -> None:
+        """Removes the published dataset; only the publisher may do this.
+
+        Processes that already attached keep their mapping until they
+        drop it.
+        """
+        assert self.__owner, "Only the publishing process may unlink"
+        os.unlink(self.path(self.name))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Persistent binary snapshots of a parsed CSV dataset.
+"""
+import hashlib
+import mmap
+import os
+import struct
+from typing import Optional, Tuple
+
+from columnar import ColumnarDataset
+
+MAGIC = b"PGSNAP\0\0"
+VERSION = 1
+PREAMBLE = struct.Struct("<8sIQq32s4x")
+
+
+def csv_digest(path: str) -> bytes:
+    """Returns the SHA-256 digest of the file at path."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def snapshot_path(csv_path: str) -> str:
+    """Returns where the snapshot of csv_path is kept."""
+    return csv_path + ".snap"
+
+
+def read_preamble(path: str) -> Optional[Tuple[int, int, bytes]]:
+    """Reads the CSV key stored at the head of a snapshot.
+
+    Returns:
+        Optional[Tuple[int, int, bytes]]: The CSV size, mtime in
+            nanoseconds and digest, or None if there is no valid snapshot.
+    """
+    try:
+        with open(path, 'rb') as file:
+            raw = file.read(PREAMBLE.size)
+    except OSError:
+        return None
+    if len(raw) != PREAMBLE.size:
+        return None
+    magic, version, size, mtime_ns, digest = PREAMBLE.unpack(raw)
+    if magic != MAGIC or version != VERSION:
+        return None
+    return size, mtime_ns, digest
+
+
+def write_snapshot(csv_path: str, dataset: ColumnarDataset,
+                   digest: bytes = None) -> None:
+    """Writes dataset to the snapshot of csv_path, replacing it atomically.
+
+    Args:
+        csv_path (str): The CSV file the dataset was parsed from.
+        dataset (ColumnarDataset): The parsed dataset.
+        digest (bytes): The CSV digest, computed if not given.
+    """
+    stat = os.stat(csv_path)
+    digest = digest or csv_digest(csv_path)
+    path = snapshot_path(csv_path)
+    temporary = "{}.{}.tmp".format(path, os.getpid())
+    with open(temporary, 'wb') as file:
+        file.write(PREAMBLE.pack(MAGIC, VERSION, stat.st_size,
+                                 stat.st_mtime_ns, digest))
+        file.write(dataset.to_bytes())
+    os.replace(temporary, path)
+
+
+def map_snapshot(path: str) -> Optional[ColumnarDataset]:
+    """Maps a snapshot file and views its dataset in place.
+
+    Returns:
+        Optional[ColumnarDataset]: The dataset, or None if the snapshot
+            is missing, truncated or corrupt.
+    """
+    try:
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return ColumnarDataset.from_buffer(
+            memoryview(mapping)[PREAMBLE.size:])
+    except (OSError, ValueError, struct.error, KeyError, TypeError):
+        return None
+
+
+def load_dataset(csv_path: str) -> ColumnarDataset:
+    """Loads csv_path from its snapshot, rebuilding it if the CSV changed.
+
+    A snapshot whose stored size and mtime match the CSV is mapped
+    directly. If either differs, the CSV is hashed: an unchanged digest
+    reuses the snapshot and refreshes its key, anything else parses the
+    CSV and writes a new snapshot, as does a snapshot that turns out
+    truncated or corrupt. Failing to write the snapshot (for instance
+    in a read-only directory) is not an error.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+
+    Returns:
+        ColumnarDataset: The dataset.
+    """
+    path = snapshot_path(csv_path)
+    stat = os.stat(csv_path)
+    stored = read_preamble(path)
+    if stored is not None and stored[:2] == (stat.st_size, stat.st_mtime_ns):
+        dataset = map_snapshot(path)
+        if dataset is not None:
+            return dataset
+        stored = None
+
+    digest = csv_digest(csv_path)
+    dataset = None
+    if stored is not None and stored[2] == digest:
+        dataset = map_snapshot(path)
+    if dataset is None:
+        dataset = ColumnarDataset.from_csv(csv_path)
+    try:
+        write_snapshot(csv_path, dataset, digest)
+    except OSError:
+        pass
+    return dataset
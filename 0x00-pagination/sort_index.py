@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Precomputed sort permutations for ordered pagination.
+"""
+from array import array
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Sequence, Tuple
+
+from columnar import ColumnarDataset, is_canonical_int
+
+MAX_CACHED_ORDERS = 128
+
+
+def parse_order(order_by: str) -> Tuple[str, bool]:
+    """Splits an order spec such as "Count desc" into column and direction.
+
+    Args:
+        order_by (str): A column name, optionally followed by "asc" or
+            "desc" (case-insensitive).
+
+    Returns:
+        Tuple[str, bool]: The column name and whether it is descending.
+    """
+    name, _, direction = order_by.strip().rpartition(' ')
+    if name and direction.lower() in ('asc', 'desc'):
+        return name.strip(), direction.lower() == 'desc'
+    return order_by.strip(), False
+
+
+class SortIndex:
+    """Row-id permutations that list rows in column order.
+
+    Each (column, direction) permutation is computed once and kept as a
+    compact integer array. Ties keep dataset order in both directions.
+    """
+
+    def __init__(self, rows: Sequence[List], length: int = None):
+        """Initializes an empty index over the first length rows, or all."""
+        self.__rows = rows
+        self.__length = len(rows) if length is None else length
+        self.__permutations = {}
+        self.__ranks = {}
+        self.__orders = OrderedDict()
+
+    def __sort_key(self, column: int) -> Callable[[int], object]:
+        """Returns a function mapping a row id to its sort key in column.
+
+        Integer columns sort numerically, everything else as text.
+        """
+        rows = self.__rows
+        if isinstance(rows, ColumnarDataset):
+            encoded = rows.columns[column]
+            values = encoded.values
+            if encoded.dictionary is None:
+                return values.__getitem__
+            order = sorted(range(len(encoded.dictionary)),
+                           key=encoded.dictionary.__getitem__)
+            rank = array('I', bytes(4 * len(order)))
+            for position, code in enumerate(order):
+                rank[code] = position
+            return lambda row_id: rank[values[row_id]]
+
+        values = [rows[row_id][column] for row_id in range(self.__length)]
+        if values and all(is_canonical_int(v) for v in set(values)):
+            values = [int(v) for v in values]
+        return values.__getitem__
+
+    def permutation(self, column: int, descending: bool = False) -> array:
+        """Returns every row id ordered by column.
+
+        Args:
+            column (int): The position of the column to sort by.
+            descending (bool): Sort from largest to smallest.
+
+        Returns:
+            array: The row ids in sorted order.
+        """
+        key = (column, descending)
+        if key not in self.__permutations:
+            self.__permutations[key] = array('I', sorted(
+                range(self.__length), key=self.__sort_key(column),
+                reverse=descending))
+
+        return self.__permutations[key]
+
+    def ranks(self, column: int, descending: bool = False) -> array:
+        """Returns each row id's rank in permutation(column, descending)."""
+        key = (column, descending)
+        if key not in self.__ranks:
+            permutation = self.permutation(column, descending)
+            ranks = array('I', bytes(4 * len(permutation)))
+            for position, row_id in enumerate(permutation):
+                ranks[row_id] = position
+            self.__ranks[key] = ranks
+
+        return self.__ranks[key]
+
+    def order(self, row_ids: Sequence[int], column: int,
+              descending: bool = False, cache_key: Hashable = None) -> array:
+        """Orders a subset of row ids by column.
+
+        Subsets are sorted by their precomputed ranks, and the result is
+        cached under cache_key when one is given.
+
+        Args:
+            row_ids (Sequence[int]): The row ids to order.
+            column (int): The position of the column to sort by.
+            descending (bool): Sort from largest to smallest.
+            cache_key (Hashable): Identifies row_ids across calls.
+
+        Returns:
+            array: row_ids in sorted order.
+        """
+        key = (cache_key, column, descending)
+        if cache_key is not None and key in self.__orders:
+            self.__orders.move_to_end(key)
+            return self.__orders[key]
+
+        ranks = self.ranks(column, descending)
+        ordered = array('I', sorted(row_ids, key=ranks.__getitem__))
+        if cache_key is not None:
+            self.__orders[key] = ordered
+            if len(self.__orders) > MAX_CACHED_ORDERS:
+                self.__orders.popitem(last=False)
+        return ordered
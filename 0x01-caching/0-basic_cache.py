@@ -8,14 +8,18 @@ class BasicCache(BaseCaching):
     Inherits from BaseCaching.
     """
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """Assigns the item to the cache under the specified key.
         Args:
             key (str): The key under which to store the item.
             item (any): The item to store in the cache.
+            ttl (float): Seconds the item stays valid; the cache's
+                default ttl if None.
         """
         if key is not None and item is not None:
+            self.expire()
             self.cache_data[key] = item
+            self._track(key, 0, ttl)
 
     def get(self, key):
         """Retrieves an item by key from the cache.
@@ -24,4 +28,6 @@ class BasicCache(BaseCaching):
         Returns:
             The item if it exists in the cache, otherwise None.
         """
-        return self.cache_data.get(key)
+        if self._missing(key):
+            return None
+        return self.cache_data[key]
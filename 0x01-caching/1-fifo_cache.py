@@ -11,23 +11,32 @@ from base_caching import BaseCaching
 class FIFOCache(BaseCaching):
     """FIFOCache that inherits from BaseCaching
     """
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ cache initalization
         """
-        super().__init__()
+        super().__init__(*args, **kwargs)
         self.cache_data = OrderedDict()
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """adding item in cache
         """
         if key is None or item is None:
             return
+        self.expire()
+        size = self._make_room(key, item)
+        if size is None:
+            return
         self.cache_data[key] = item
-        if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-            first_key, _ = self.cache_data.popitem(False)
-            print("DISCARD:", first_key)
+        self._track(key, size, ttl)
 
     def get(self, key):
         """ Return an Item by key
         """
-        return self.cache_data.get(key, None)
+        if self._missing(key):
+            return None
+        return self.cache_data[key]
+
+    def _eviction_order(self):
+        """ Oldest inserted key first
+        """
+        return iter(self.cache_data)
@@ -7,59 +7,95 @@ from base_caching import BaseCaching
 
 class LFUCache(BaseCaching):
     """LFUCache that inherits from BaseCaching.
-    Implements a Least Frequently Used (LFU) caching eviction policy.
+    Implements a Least Frequently Used (LFU) caching eviction policy,
+    breaking ties between equally used keys by evicting the least
+    recently used one.
+
+    Keys are kept in frequency buckets, each ordered from least to most
+    recently used, and the lowest non-empty frequency is tracked, so
+    both get and put run in constant time.
     """
 
-    def __init__(self):
-        """Initialize LFUCache with an ordered dictionary for caching and
-        a frequency dictionary for tracking access counts.
+    def __init__(self, *args, **kwargs):
+        """Initialize LFUCache with the cache dictionary, the access count
+        of each key and the recency-ordered bucket of keys per count.
         """
-        super().__init__()
-        self.cache_data = OrderedDict()
+        super().__init__(*args, **kwargs)
         self.freq = {}
+        self.buckets = {}
+        self.min_freq = 0
 
     def __update_frequency(self, key):
-        """Helper function to update the frequency of access for the given key."""
-        if key in self.freq:
-            self.freq[key] += 1
+        """Helper function to move key to the bucket of its next count."""
+        count = self.freq.get(key, 0)
+        if count:
+            bucket = self.buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[count]
+                if self.min_freq == count:
+                    self.min_freq = count + 1
         else:
-            self.freq[key] = 1
-        # Reorder the cache based on frequency
-        self.cache_data.move_to_end(key)
+            self.min_freq = 1
+        self.freq[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """Adds an item in the cache using LFU policy.
-        If the cache exceeds its limit, removes the least frequently used item.
-        
+        If the cache exceeds its limit, removes the least frequently used
+        item, the least recently used one among ties.
+
         Args:
             key (str): The key under which the item will be stored.
             item (any): The item to cache.
+            ttl (float): Seconds the item stays valid; the cache's
+                default ttl if None.
         """
         if key is None or item is None:
             return
 
-        if key not in self.cache_data and len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            # Find and remove LFU item
-            lfu_key = min(self.freq, key=self.freq.get)
-            self.cache_data.pop(lfu_key)
-            self.freq.pop(lfu_key)
-            print("DISCARD:", lfu_key)
+        self.expire()
+        size = self._make_room(key, item)
+        if size is None:
+            return
 
         # Insert or update item and adjust frequency
         self.cache_data[key] = item
         self.__update_frequency(key)
+        self._track(key, size, ttl)
 
     def get(self, key):
         """Retrieves an item by key and updates its access frequency.
-        
+
         Args:
             key (str): The key of the item to retrieve.
-        
+
         Returns:
             The cached item if found, otherwise None.
         """
-        if key in self.cache_data:
+        if not self._missing(key):
             self.__update_frequency(key)
             return self.cache_data[key]
         return None
 
+    def _eviction_order(self):
+        """Yields the least frequently used keys first, least recently
+        used first among equals.
+        """
+        if not self.buckets:
+            return
+        if self.min_freq not in self.buckets:
+            # An eviction emptied the lowest bucket during an update
+            self.min_freq = min(self.buckets)
+        yield from self.buckets[self.min_freq]
+        for count in sorted(self.buckets):
+            if count != self.min_freq:
+                yield from self.buckets[count]
+
+    def _forget(self, key):
+        """Removes an evicted key from its frequency bucket."""
+        count = self.freq.pop(key)
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Adaptive Replacement Cache (ARC) module."""
+
+from collections import OrderedDict
+from base_caching import BaseCaching
+
+
+class ARCCache(BaseCaching):
+    """ARCCache that inherits from BaseCaching.
+    Implements the Adaptive Replacement Cache eviction policy.
+
+    Keys seen once live in the recency list t1 and keys seen again in
+    the frequency list t2, each ordered from least to most recently
+    used. Evicted keys are remembered, without their items, in the
+    ghost lists b1 and b2. A miss that hits b1 means t1 was too small
+    and grows its target size p; a miss that hits b2 shrinks it. A
+    sequential scan only ever fills t1, so it cannot flush the keys
+    that t2 holds. Every operation is O(1).
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize ARCCache with its two resident and two ghost lists
+        and the target size of t1.
+        """
+        super().__init__(*args, **kwargs)
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+        self.p = 0
+        self.prefer_t1 = True
+
+    def __adapt(self, key):
+        """Moves the target size of t1 towards the ghost list key is in,
+        and decides which list to evict from to make room for key.
+        """
+        if key in self.b1:
+            self.p = min(self.p + max(len(self.b2) / len(self.b1), 1),
+                         self.MAX_ITEMS)
+        elif key in self.b2:
+            self.p = max(self.p - max(len(self.b1) / len(self.b2), 1), 0)
+        self.prefer_t1 = bool(self.t1) and (
+            len(self.t1) > self.p
+            or key in self.b2 and len(self.t1) == self.p)
+
+    def __trim_ghosts(self):
+        """Bounds the ghost lists to the sizes ARC keeps."""
+        while self.b1 and len(self.t1) + len(self.b1) > self.MAX_ITEMS:
+            self.b1.popitem(last=False)
+        while len(self.t1) + len(self.t2) + len(self.b1) + len(
+                self.b2) > 2 * self.MAX_ITEMS:
+            (self.b2 or self.b1).popitem(last=False)
+
+    def put(self, key, item, ttl=None):
+        """Adds an item in the cache using ARC policy.
+        If the cache exceeds its limit, removes the least recently used
+        item of t1 or t2, as the adaptive target size says.
+
+        Args:
+            key (str): The key under which the item will be stored.
+            item (any): The item to cache.
+            ttl (float): Seconds the item stays valid; the cache's
+                default ttl if None.
+        """
+        if key is None or item is None:
+            return
+
+        self.expire()
+        self.__adapt(key)
+        size = self._make_room(key, item)
+        if size is None:
+            return
+
+        # Keys seen before go to t2, new keys to t1
+        self.cache_data[key] = item
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        elif key in self.t2:
+            self.t2.move_to_end(key)
+        elif key in self.b1 or key in self.b2:
+            self.b1.pop(key, None)
+            self.b2.pop(key, None)
+            self.t2[key] = None
+        else:
+            self.t1[key] = None
+        self.__trim_ghosts()
+        self._track(key, size, ttl)
+
+    def get(self, key):
+        """Retrieves an item by key and moves it to the frequency list.
+
+        Args:
+            key (str): The key of the item to retrieve.
+
+        Returns:
+            The cached item if found, otherwise None.
+        """
+        if self._missing(key):
+            return None
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        else:
+            self.t2.move_to_end(key)
+        return self.cache_data[key]
+
+    def _eviction_order(self):
+        """Yields the least recently used keys of the list ARC evicts from
+        first, then those of the other list.
+        """
+        first, second = (self.t1, self.t2) if self.prefer_t1 else (
+            self.t2, self.t1)
+        yield from first
+        yield from second
+
+    def _evict(self, key):
+        """Evicts key and remembers it in the matching ghost list."""
+        ghosts = self.b1 if key in self.t1 else self.b2
+        super()._evict(key)
+        ghosts[key] = None
+
+    def _forget(self, key):
+        """Removes a dropped key from its resident list."""
+        self.t1.pop(key, None)
+        self.t2.pop(key, None)
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+""" 102-main """
+TinyLFUCache = __import__('102-tinylfu_cache').TinyLFUCache
+LRUCache = __import__('3-lru_cache').LRUCache
+print_discard = __import__('base_caching').print_discard
+
+my_cache = TinyLFUCache()
+my_cache.add_listener(print_discard)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.put("D", "School")
+my_cache.print_cache()
+print(my_cache.get("B"))
+print(my_cache.get("C"))
+my_cache.put("E", "Battery")
+my_cache.print_cache()
+my_cache.put("F", "Mission")
+my_cache.print_cache()
+print(my_cache.get("A"))
+my_cache.put("A", "Hello again")
+my_cache.print_cache()
+print(list(my_cache.window), list(my_cache.probation),
+      list(my_cache.protected))
+my_cache.put("G", "San Francisco")
+my_cache.print_cache()
+
+
+def hit_ratio(cache):
+    """ Replay a hot set, read twice a round, between one-off scans """
+    for turn in range(20):
+        scan = range(1000 + 100 * turn, 1100 + 100 * turn)
+        for key in list(range(50)) * 2 + list(scan):
+            if cache.get(key) is None:
+                cache.put(key, key)
+    return round(cache.stats()['hit_ratio'], 2)
+
+
+# A scan does not flush the keys used again and again
+print(hit_ratio(LRUCache(max_items=100)),
+      hit_ratio(TinyLFUCache(max_items=100)))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Window Tiny Least Frequently Used (W-TinyLFU) Caching module."""
+
+from collections import OrderedDict
+from base_caching import BaseCaching
+from count_min_sketch import CountMinSketch
+
+
+class TinyLFUCache(BaseCaching):
+    """TinyLFUCache that inherits from BaseCaching.
+    Implements the W-TinyLFU eviction policy.
+
+    New keys enter a small LRU window. The key falling out of a full
+    window only gets into the main cache if a count-min sketch of
+    recent accesses says it is used more than the main cache's next
+    victim; otherwise the newcomer is evicted instead. The main cache
+    is a segmented LRU: keys start on probation and move to the
+    protected segment when used again. The sketch ages, so keys that
+    were popular once are forgotten. Every operation is O(1) amortized.
+    """
+
+    WINDOW_SHARE = 0.01
+    PROTECTED_SHARE = 0.8
+
+    def __init__(self, *args, **kwargs):
+        """Initialize TinyLFUCache with its window, probation and protected
+        segments and the frequency sketch.
+        """
+        super().__init__(*args, **kwargs)
+        self.window = OrderedDict()
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        self.window_size = max(1, round(self.MAX_ITEMS * self.WINDOW_SHARE))
+        self.protected_size = int(
+            (self.MAX_ITEMS - self.window_size) * self.PROTECTED_SHARE)
+        self.sketch = CountMinSketch(self.MAX_ITEMS)
+
+    def __touch(self, key):
+        """Marks key as used, promoting it from probation to protected."""
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        else:
+            del self.probation[key]
+            self.protected[key] = None
+            while len(self.protected) > self.protected_size:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+
+    def put(self, key, item, ttl=None):
+        """Adds an item in the cache using W-TinyLFU policy.
+        If the cache exceeds its limit, evicts whichever of the window's
+        oldest key and the main cache's victim is used less.
+
+        Args:
+            key (str): The key under which the item will be stored.
+            item (any): The item to cache.
+            ttl (float): Seconds the item stays valid; the cache's
+                default ttl if None.
+        """
+        if key is None or item is None:
+            return
+
+        self.expire()
+        self.sketch.increment(key)
+        size = self._make_room(key, item)
+        if size is None:
+            return
+
+        if key in self.cache_data:
+            self.__touch(key)
+        else:
+            self.window[key] = None
+            while len(self.window) > self.window_size:
+                candidate, _ = self.window.popitem(last=False)
+                self.probation[candidate] = None
+        self.cache_data[key] = item
+        self._track(key, size, ttl)
+
+    def get(self, key):
+        """Retrieves an item by key and records the access.
+
+        Args:
+            key (str): The key of the item to retrieve.
+
+        Returns:
+            The cached item if found, otherwise None.
+        """
+        self.sketch.increment(key)
+        if self._missing(key):
+            return None
+        self.__touch(key)
+        return self.cache_data[key]
+
+    def _eviction_order(self):
+        """Yields the loser of the admission duel between the window's
+        oldest key and the main cache's victim first, then every key
+        from probation, the window and protected, oldest first.
+        """
+        main = self.probation or self.protected
+        victim = next(iter(main), None)
+        if len(self.window) >= self.window_size and victim is not None:
+            candidate = next(iter(self.window))
+            if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+                yield victim
+            else:
+                yield candidate
+        yield from self.probation
+        yield from self.window
+        yield from self.protected
+
+    def _forget(self, key):
+        """Removes a dropped key from its segment."""
+        self.window.pop(key, None)
+        self.probation.pop(key, None)
+        self.protected.pop(key, None)
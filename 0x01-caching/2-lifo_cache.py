@@ -9,25 +9,31 @@ class LIFOCache(BaseCaching):
     Implements Last-In, First-Out removal strategy when limit is reached.
     """
     
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """Initialize LIFOCache with an ordered dictionary for caching."""
-        super().__init__()
+        super().__init__(*args, **kwargs)
         self.cache_data = OrderedDict()
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """Adds an item to the cache using LIFO policy.
         Discards the most recently added item when the cache limit is exceeded.
         
         Args:
             key (str): The key under which the item will be stored.
             item (any): The item to cache.
+            ttl (float): Seconds the item stays valid; the cache's
+                default ttl if None.
         """
         if key is not None and item is not None:
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                last_key, _ = self.cache_data.popitem(last=True)
-                print("DISCARD:", last_key)
+            self.expire()
+            if self.cache_data and len(self.cache_data) >= self.MAX_ITEMS:
+                self._evict(next(reversed(self.cache_data)))
+            size = self._make_room(key, item)
+            if size is None:
+                return
             self.cache_data[key] = item
             self.cache_data.move_to_end(key, last=True)
+            self._track(key, size, ttl)
 
     def get(self, key):
         """Retrieves an item by key from the cache.
@@ -38,5 +44,11 @@ class LIFOCache(BaseCaching):
         Returns:
             The cached item if found, otherwise None.
         """
-        return self.cache_data.get(key)
+        if self._missing(key):
+            return None
+        return self.cache_data[key]
+
+    def _eviction_order(self):
+        """Yields the most recently added keys first."""
+        return reversed(self.cache_data)
 
@@ -9,12 +9,12 @@ class LRUCache(BaseCaching):
        implements a caching system with an LRU eviction policy.
     """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """Initialize the LRUCache with an ordered dictionary for LRU tracking."""
-        super().__init__()
+        super().__init__(*args, **kwargs)
         self.cache_data = OrderedDict()
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """Add an item to the cache.
         
         If the cache exceeds the limit, evict the least recently used item.
@@ -22,18 +22,22 @@ class LRUCache(BaseCaching):
         Args:
             key (str): The key under which the item will be stored.
             item (any): The item to cache.
+            ttl (float): Seconds the item stays valid; the cache's
+                default ttl if None.
         """
         if key is None or item is None:
             return
 
-        # Remove least recently used item if cache exceeds limit
-        if key not in self.cache_data and len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            lru_key, _ = self.cache_data.popitem(last=False)
-            print("DISCARD:", lru_key)
+        # Remove least recently used items until the new one fits
+        self.expire()
+        size = self._make_room(key, item)
+        if size is None:
+            return
 
         # Add or update the item and mark as most recently used
         self.cache_data[key] = item
         self.cache_data.move_to_end(key)
+        self._track(key, size, ttl)
 
     def get(self, key):
         """Retrieve an item from the cache by key, updating its recent use.
@@ -44,9 +48,13 @@ class LRUCache(BaseCaching):
         Returns:
             The cached item if found, otherwise None.
         """
-        if key is not None and key in self.cache_data:
+        if not self._missing(key):
             # Mark the accessed key as most recently used
             self.cache_data.move_to_end(key)
             return self.cache_data[key]
         return None
 
+    def _eviction_order(self):
+        """Yields the least recently used keys first."""
+        return iter(self.cache_data)
+
@@ -9,27 +9,32 @@ class MRUCache(BaseCaching):
     Implements a Most Recently Used (MRU) eviction policy when the cache limit is reached.
     """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """Initialize MRUCache with an ordered dictionary for caching."""
-        super().__init__()
+        super().__init__(*args, **kwargs)
         self.cache_data = OrderedDict()
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """Adds an item to the cache using MRU policy.
         If the cache exceeds its limit, removes the most recently used item.
         
         Args:
             key (str): The key under which the item will be stored.
             item (any): The item to cache.
+            ttl (float): Seconds the item stays valid; the cache's
+                default ttl if None.
         """
         if key is not None and item is not None:
-            # If cache is full, remove the most recently used item
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS and key not in self.cache_data:
-                mru_key, _ = self.cache_data.popitem(last=False)
-                print("DISCARD:", mru_key)
+            # Drop expired items, then the most recently used ones until
+            # the new one fits
+            self.expire()
+            size = self._make_room(key, item)
+            if size is None:
+                return
             # Add or update item and mark it as most recently used
             self.cache_data[key] = item
             self.cache_data.move_to_end(key, last=False)
+            self._track(key, size, ttl)
 
     def get(self, key):
         """Retrieves an item by key and updates it as the most recently used.
@@ -40,9 +45,13 @@ class MRUCache(BaseCaching):
         Returns:
             The cached item if found, otherwise None.
         """
-        if key in self.cache_data:
+        if not self._missing(key):
             # Mark the item as most recently used
             self.cache_data.move_to_end(key, last=False)
             return self.cache_data[key]
         return None
 
+    def _eviction_order(self):
+        """Yields the most recently used keys first."""
+        return iter(self.cache_data)
+
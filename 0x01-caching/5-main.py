@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+""" 5-main """
+import threading
+
+ShardedCache = __import__('5-sharded_cache').ShardedCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+print_discard = __import__('base_caching').print_discard
+
+# Integer keys hash the same in every run, so shards are predictable
+my_cache = ShardedCache(shards=4, exact=True, max_items=4)
+my_cache.add_listener(print_discard)
+for key in range(1, 7):
+    my_cache.put(key, "Item {}".format(key))
+print(len(my_cache))
+print(sorted(my_cache.cache_data))
+
+# Any policy can back the shards, with per-shard budgets
+my_cache = ShardedCache(policy=LFUCache, shards=4, max_items=8)
+print([shard.MAX_ITEMS for shard in my_cache.shards])
+
+# Threads hammering the cache never take it over its exact bound
+my_cache = ShardedCache(shards=8, exact=True, max_items=100,
+                        sample_every=10)
+
+
+def hammer(offset):
+    """ Put and get a range of keys """
+    for i in range(2000):
+        my_cache.put(offset + i % 300, i)
+        my_cache.get(offset + (i * 7) % 300)
+
+
+threads = [threading.Thread(target=hammer, args=(n * 1000,))
+           for n in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+stats = my_cache.stats()
+print(len(my_cache), len(my_cache.cache_data), stats['puts'])
+print(stats['hits'] + stats['misses'])
+
+# Sampled latencies are recorded through the shards
+print({name: summary['samples']
+       for name, summary in stats['latency'].items()})
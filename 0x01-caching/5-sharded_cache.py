@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Thread-safe cache sharded across independently locked policies."""
+
+import math
+import threading
+from operator import methodcaller
+
+from latency_histogram import LatencyHistogram
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class ShardedCache():
+    """Cache that hash-partitions keys across shards of any BaseCaching
+    policy, each behind its own lock, so threads working on different
+    shards never wait for each other.
+
+    In approximate mode each shard holds its share of the capacity and
+    evicts on its own, so the cache may hold less than max_items when
+    keys hash unevenly. In exact mode the shards share one budget: a put
+    that takes the cache over it evicts by the policy from the shard it
+    wrote to, then from the next shards, until the whole cache is back
+    within max_items and max_weight. The bound holds whenever no put is
+    in flight; concurrent puts may overshoot it by one entry each.
+    """
+
+    def __init__(self, policy=LRUCache, shards=16, exact=False,
+                 max_items=None, max_weight=None, **kwargs):
+        """Initialize the shards.
+
+        Args:
+            policy (type): The BaseCaching subclass each shard uses.
+            shards (int): The number of shards.
+            exact (bool): Whether max_items and max_weight bound the whole
+                cache exactly, rather than each shard to its share.
+            max_items (int): The most items kept; policy.MAX_ITEMS if None.
+            max_weight (int): The most total weight kept; no weight limit
+                if None.
+            **kwargs: More arguments for every shard, e.g. ttl or sizer.
+        """
+        if max_items is None:
+            max_items = policy.MAX_ITEMS
+        self.max_items = max_items
+        self.max_weight = max_weight
+        self.exact = exact
+        if exact:
+            # The shards never fill up on their own; put() evicts instead
+            limits = dict(max_items=max_items, max_weight=max_weight)
+        else:
+            limits = dict(
+                max_items=math.ceil(max_items / shards),
+                max_weight=(None if max_weight is None
+                            else math.ceil(max_weight / shards)))
+        self.shards = [policy(**limits, **kwargs) for _ in range(shards)]
+        self.listeners = []
+        for shard in self.shards:
+            shard.add_listener(self.__notify)
+        self.locks = [threading.Lock() for _ in range(shards)]
+        self.__totals_lock = threading.Lock()
+        self.__size = 0
+        self.__weight = 0
+
+    def __len__(self):
+        """Returns the number of cached items."""
+        return self.__size
+
+    def __index(self, key):
+        """Returns the index of the shard holding key."""
+        return hash(key) % len(self.shards)
+
+    def __count(self, items, weight):
+        """Adds the change in a shard's items and weight to the totals."""
+        if items or weight:
+            with self.__totals_lock:
+                self.__size += items
+                self.__weight += weight
+
+    def __over(self):
+        """Tells whether the whole cache is over either limit."""
+        return (self.__size > self.max_items
+                or self.max_weight is not None
+                and self.__weight > self.max_weight)
+
+    def __call(self, index, call):
+        """Runs call(shard) under the shard's lock, updating the totals."""
+        shard = self.shards[index]
+        with self.locks[index]:
+            items, weight = len(shard.cache_data), shard.weight
+            result = call(shard)
+            items = len(shard.cache_data) - items
+            weight = shard.weight - weight
+        self.__count(items, weight)
+        return result
+
+    def __evict_one(self, shard, key):
+        """Evicts the shard's next victim other than key.
+
+        Returns:
+            bool: False if the shard had nothing else to evict.
+        """
+        victim = next(
+            (other for other in shard._eviction_order() if other != key),
+            None)
+        if victim is None:
+            return False
+        shard._evict(victim)
+        return True
+
+    def __notify(self, key, item):
+        """Passes a shard's eviction on to the listeners."""
+        for listener in self.listeners:
+            listener(key, item)
+
+    def add_listener(self, listener):
+        """Calls listener(key, item) for every item evicted to make room.
+
+        Listeners run under the lock of the evicting shard.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Stops calling a listener added with add_listener()."""
+        self.listeners.remove(listener)
+
+    def stats(self):
+        """Returns the shards' counters summed, the hit ratio, the size and
+        the shards' latencies merged."""
+        totals = dict.fromkeys(
+            ('hits', 'misses', 'puts', 'evictions', 'expirations'), 0)
+        for shard in self.shards:
+            for name in totals:
+                totals[name] += getattr(shard, name)
+        lookups = totals['hits'] + totals['misses']
+        totals['hit_ratio'] = totals['hits'] / lookups if lookups else None
+        totals['size'] = self.__size
+        totals['weight'] = self.__weight
+        latency = {}
+        for shard in self.shards:
+            for name, histogram in shard.latency.items():
+                latency.setdefault(name, LatencyHistogram()).merge(histogram)
+        totals['latency'] = {name: histogram.summary()
+                             for name, histogram in latency.items()}
+        return totals
+
+    def put(self, key, item, ttl=None):
+        """Adds an item to the shard that key hashes to.
+
+        Args:
+            key (str): The key under which the item will be stored.
+            item (any): The item to cache.
+            ttl (float): Seconds the item stays valid; the shards' default
+                ttl if None.
+        """
+        if key is None or item is None:
+            return
+        home = self.__index(key)
+        self.__call(home, methodcaller('put', key, item, ttl))
+        if not self.exact:
+            return
+        for step in range(len(self.shards)):
+            index = (home + step) % len(self.shards)
+            while self.__over():
+                if not self.__call(
+                        index, lambda shard: self.__evict_one(shard, key)):
+                    break
+            if not self.__over():
+                break
+
+    def get(self, key):
+        """Retrieves an item by key from the shard that key hashes to.
+
+        Args:
+            key (str): The key of the item to retrieve.
+
+        Returns:
+            The cached item if found, otherwise None.
+        """
+        index = self.__index(key)
+        return self.__call(index, methodcaller('get', key))
+
+    def delete(self, key):
+        """Removes key from the shard it hashes to, counting no eviction.
+
+        Args:
+            key (str): The key of the item to remove.
+
+        Returns:
+            bool: Whether key was cached.
+        """
+        index = self.__index(key)
+        return self.__call(index, methodcaller('delete', key))
+
+    def expire(self):
+        """Drops every expired item from every shard."""
+        for index in range(len(self.shards)):
+            self.__call(index, methodcaller('expire'))
+
+    @property
+    def cache_data(self):
+        """A copy of every cached item, taken one shard at a time."""
+        data = {}
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                data.update(shard.cache_data)
+        return data
+
+    def print_cache(self):
+        """Print the cache."""
+        print("Current cache:")
+        data = self.cache_data
+        for key in sorted(data.keys()):
+            print("{}: {}".format(key, data.get(key)))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Memoization decorator backed by the caching policies."""
+
+import sys
+from collections import namedtuple
+from functools import update_wrapper
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+FAST_TYPES = {int, str}
+KWD_MARK = object()
+
+
+def make_key(args, kwargs, typed=False):
+    """Builds a hashable key from a call's arguments.
+
+    A lone int or str argument is its own key, which saves building a
+    tuple for the most common calls.
+    """
+    key = args
+    if kwargs:
+        key += (KWD_MARK,) + tuple(kwargs.items())
+    if typed:
+        key += tuple(type(value) for value in args)
+        if kwargs:
+            key += tuple(type(value) for value in kwargs.values())
+    elif len(key) == 1 and type(key[0]) in FAST_TYPES:
+        return key[0]
+    return key
+
+
+def cached(policy=LRUCache, maxsize=128, ttl=None, cache=None, typed=False,
+           **kwargs):
+    """Memoizes a function's results in a BaseCaching policy.
+
+    Results are stored wrapped in a 1-tuple, so None results are cached
+    too. Like the policies themselves, the cache is not thread-safe.
+
+    Args:
+        policy (type): The BaseCaching subclass choosing what to evict.
+        maxsize (int): The most results kept; unbounded if None.
+        ttl (float): Seconds a result stays valid; forever if None.
+        cache (BaseCaching): A cache to share with other functions,
+            instead of a new one from policy, maxsize, ttl and kwargs;
+            a ShardedCache works too.
+        typed (bool): Whether arguments of different types, like 1 and
+            1.0, are cached apart.
+        **kwargs: More arguments for policy, e.g. max_weight.
+
+    Returns:
+        The decorator. Unless cache is given, every function it wraps
+        gets a cache of its own. The wrapped function gains cache_info(),
+        cache_clear() and a cache attribute.
+    """
+    shared = cache is not None
+
+    def decorator(function):
+        """Wraps function with the shared cache or a cache of its own."""
+        if shared:
+            store = cache
+        else:
+            limit = sys.maxsize if maxsize is None else maxsize
+            store = policy(max_items=limit, ttl=ttl, **kwargs)
+        stats = [0, 0]
+
+        def wrapper(*args, **kwds):
+            """Returns the cached result, calling function on a miss."""
+            key = make_key(args, kwds, typed)
+            if shared:
+                key = (wrapper, key)
+            entry = store.get(key)
+            if entry is not None:
+                stats[0] += 1
+                return entry[0]
+            stats[1] += 1
+            result = function(*args, **kwds)
+            store.put(key, (result,))
+            return result
+
+        def cache_info():
+            """Returns this function's hits and misses and the cache's
+            capacity and size.
+            """
+            capacity = store.max_items if shared else maxsize
+            return CacheInfo(stats[0], stats[1], capacity,
+                             len(store.cache_data))
+
+        def cache_clear():
+            """Drops this function's results and zeroes its counters."""
+            if shared:
+                keys = [key for key in store.cache_data
+                        if type(key) is tuple and len(key) == 2
+                        and key[0] is wrapper]
+            else:
+                keys = list(store.cache_data)
+            for key in keys:
+                store.delete(key)
+            stats[:] = [0, 0]
+
+        wrapper.cache = store
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return update_wrapper(wrapper, function)
+
+    return decorator
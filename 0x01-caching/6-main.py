@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+""" 6-main """
+cached = __import__('6-cached').cached
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+TinyLFUCache = __import__('102-tinylfu_cache').TinyLFUCache
+ShardedCache = __import__('5-sharded_cache').ShardedCache
+
+calls = []
+
+
+@cached(maxsize=2)
+def square(x):
+    """ Return x squared """
+    calls.append(x)
+    return x * x
+
+
+@cached(maxsize=2)
+def cube(x):
+    """ Return x cubed """
+    calls.append(x)
+    return x * x * x
+
+
+# Each function gets its own cache, so equal arguments never collide
+print(square(2), cube(2), square(2), cube(2))
+print(calls)
+print(square.cache_info(), cube.cache_info())
+print(square.cache is not cube.cache)
+
+# The least recently used result is evicted
+square(3)
+square(4)
+square(2)
+print(calls)
+
+
+# None results are cached too
+@cached(policy=LFUCache, maxsize=4)
+def find(name):
+    """ Return nothing, once """
+    calls.append(name)
+
+
+find("Bob")
+find("Bob")
+print(calls[-2:], find.cache_info())
+
+# A shared cache keeps each function's results apart
+shared = LRUCache(max_items=8)
+
+
+@cached(cache=shared)
+def double(x):
+    """ Return 2 x """
+    return 2 * x
+
+
+@cached(cache=shared)
+def triple(x):
+    """ Return 3 x """
+    return 3 * x
+
+
+print(double(5), triple(5), double(5), triple(5), len(shared.cache_data))
+double.cache_clear()
+print(double.cache_info(), triple.cache_info())
+
+
+# typed keeps 1 and 1.0 apart
+@cached(typed=True)
+def kind(x):
+    """ Return the type name of x """
+    return type(x).__name__
+
+
+print(kind(1), kind(1.0), kind.cache_info().currsize)
+
+
+# maxsize=0 caches nothing
+@cached(maxsize=0)
+def negate(x):
+    """ Return -x """
+    calls.append(x)
+    return -x
+
+
+negate(7)
+negate(7)
+print(calls[-2:], negate.cache_info())
+
+
+# maxsize=None keeps every result, whatever the policy
+@cached(maxsize=None)
+def halve(x):
+    """ Return x / 2 """
+    return x / 2
+
+
+@cached(policy=TinyLFUCache, maxsize=None)
+def quarter(x):
+    """ Return x / 4 """
+    return x / 4
+
+
+for x in range(1000):
+    halve(x)
+    quarter(x)
+print(halve.cache_info(), quarter.cache_info().currsize)
+
+# A sharded cache can back several functions as well
+sharded = ShardedCache(shards=4, max_items=64)
+
+
+@cached(cache=sharded)
+def increment(x):
+    """ Return x + 1 """
+    return x + 1
+
+
+@cached(cache=sharded)
+def decrement(x):
+    """ Return x - 1 """
+    return x - 1
+
+
+for x in range(10):
+    increment(x)
+    decrement(x)
+increment.cache_clear()
+print(increment.cache_info(), decrement.cache_info(), len(sharded))
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+""" base_caching-main """
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+MRUCache = __import__('4-mru_cache').MRUCache
+base_caching = __import__('base_caching')
+print_discard = base_caching.print_discard
+
+# Each instance has its own capacity
+small = FIFOCache(max_items=2)
+large = FIFOCache(max_items=6)
+small.add_listener(print_discard)
+for key in "ABCDEF":
+    small.put(key, key.lower())
+    large.put(key, key.lower())
+small.print_cache()
+print(len(large.cache_data), FIFOCache.MAX_ITEMS)
+
+# Items are weighed with what their containers hold
+print(base_caching.deep_sizeof(["x" * 1000]) > 1000)
+my_cache = MRUCache(max_items=10, max_weight=3000)
+my_cache.add_listener(print_discard)
+my_cache.put("A", ["a" * 1000])
+my_cache.put("B", ["b" * 1000])
+my_cache.put("C", {"c": "c" * 1000})
+print(sorted(my_cache.cache_data))
+print(my_cache.weight <= 3000)
+
+# An item heavier than the whole budget is not cached
+my_cache.put("D", ["d" * 5000])
+print(my_cache.get("D"), len(my_cache.cache_data))
+
+# A custom sizer counts anything, here the number of lines
+lines = FIFOCache(max_weight=5, sizer=lambda text: text.count("\n") + 1)
+lines.add_listener(print_discard)
+lines.put("A", "one\ntwo")
+lines.put("B", "three\nfour\nfive")
+lines.put("C", "six")
+lines.print_cache()
+
+# A cache of size 0 holds nothing
+nothing = FIFOCache(max_items=0)
+nothing.put("A", "Hello")
+print(nothing.get("A"), len(nothing.cache_data))
@@ -1,6 +1,43 @@
 #!/usr/bin/python3
 """ BaseCaching module
 """
+import sys
+import time
+
+from latency_histogram import LatencyHistogram
+from timer_wheel import TimerWheel
+
+
+def deep_sizeof(item):
+    """ Return the size in bytes of item and of every object reachable
+    through its built-in containers: dict keys and values and the
+    elements of lists, tuples, sets and frozensets
+
+    Objects reached twice are counted once. Attributes of other objects
+    are not followed; pass a sizer that knows them instead.
+    """
+    size = 0
+    seen = set()
+    pending = [item]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+    return size
+
+
+def print_discard(key, item):
+    """ Eviction listener printing the evicted key
+    """
+    print("DISCARD:", key)
+
 
 class BaseCaching():
     """ BaseCaching defines:
@@ -9,10 +46,71 @@ class BaseCaching():
     """
     MAX_ITEMS = 4
 
-    def __init__(self):
+    def __init__(self, max_items=None, max_weight=None, sizer=None,
+                 ttl=None, clock=time.monotonic, sample_every=None):
         """ Initiliaze
+
+        Args:
+            max_items (int): The most items kept at once; MAX_ITEMS if None.
+                Nothing is cached if 0.
+            max_weight (int): The most total weight kept at once, e.g. in
+                bytes; no weight limit if None.
+            sizer (callable): Gives the weight of an item; deep_sizeof,
+                the bytes of the item and its built-in containers' contents,
+                if None.
+            ttl (float): Seconds an item stays valid unless put() says
+                otherwise; items never expire if None.
+            clock (callable): Gives the current time in seconds.
+            sample_every (int): Time one get() and put() in every
+                sample_every into latency histograms; none are timed if
+                None.
         """
         self.cache_data = {}
+        if max_items is not None:
+            self.MAX_ITEMS = max_items
+        self.max_weight = max_weight
+        self.sizer = sizer or deep_sizeof
+        self.weights = {}
+        self.weight = 0
+        self.ttl = ttl
+        self.clock = clock
+        self.deadlines = {}
+        self.timers = TimerWheel(now=clock())
+        self.listeners = []
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.latency = {}
+        if sample_every:
+            for name in ('get', 'put'):
+                self.latency[name] = LatencyHistogram()
+                setattr(self, name, self.__sampled(
+                    getattr(self, name), self.latency[name], sample_every))
+
+    @staticmethod
+    def __sampled(method, histogram, every):
+        """ Wrap method to time one call in every every calls
+        """
+        calls = [0]
+
+        def sampled(*args, **kwargs):
+            calls[0] += 1
+            if calls[0] % every:
+                return method(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.record(time.perf_counter_ns() - start)
+        return sampled
+
+    @property
+    def max_items(self):
+        """ The most items kept at once
+        """
+        return self.MAX_ITEMS
 
     def print_cache(self):
         """ Print the cache
@@ -21,8 +119,35 @@ class BaseCaching():
         for key in sorted(self.cache_data.keys()):
             print("{}: {}".format(key, self.cache_data.get(key)))
 
-    def put(self, key, item):
-        """ Add an item in the cache
+    def add_listener(self, listener):
+        """ Call listener(key, item) for every item evicted to make room
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """ Stop calling a listener added with add_listener()
+        """
+        self.listeners.remove(listener)
+
+    def stats(self):
+        """ Return the counters, the hit ratio, the size and the latencies
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else None,
+            'puts': self.puts,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': len(self.cache_data),
+            'weight': self.weight,
+            'latency': {name: histogram.summary()
+                        for name, histogram in self.latency.items()},
+        }
+
+    def put(self, key, item, ttl=None):
+        """ Add an item in the cache, valid for ttl seconds
         """
         raise NotImplementedError("put must be implemented in your cache class")
 
@@ -30,3 +155,112 @@ class BaseCaching():
         """ Get an item by key
         """
         raise NotImplementedError("get must be implemented in your cache class")
+
+    def delete(self, key):
+        """ Remove key from the cache without counting an eviction
+
+        Returns:
+            bool: Whether key was cached.
+        """
+        if key not in self.cache_data:
+            return False
+        self._remove(key)
+        return True
+
+    def _eviction_order(self):
+        """ Yield the cached keys, the next one to evict first
+        """
+        raise NotImplementedError(
+            "_eviction_order must be implemented in your cache class")
+
+    def _forget(self, key):
+        """ Drop the policy's own bookkeeping for an evicted key
+        """
+
+    def expire(self):
+        """ Drop every item whose time to live has run out
+        """
+        now = self.clock()
+        for key in self.timers.advance(now):
+            if key in self.cache_data:
+                self._remove(key)
+                self.expirations += 1
+
+    def _remove(self, key):
+        """ Remove key from the cache
+        """
+        del self.cache_data[key]
+        self.weight -= self.weights.pop(key, 0)
+        if self.deadlines.pop(key, None) is not None:
+            self.timers.cancel(key)
+        self._forget(key)
+
+    def _evict(self, key):
+        """ Remove key from the cache and tell the listeners
+        """
+        item = self.cache_data[key]
+        self._remove(key)
+        self.evictions += 1
+        for listener in self.listeners:
+            listener(key, item)
+
+    def _missing(self, key):
+        """ Count a lookup of key and tell whether it misses, dropping
+        key if it has expired
+        """
+        deadline = self.deadlines.get(key)
+        if deadline is not None and deadline <= self.clock():
+            self._remove(key)
+            self.expirations += 1
+        if key in self.cache_data:
+            self.hits += 1
+            return False
+        self.misses += 1
+        return True
+
+    def _make_room(self, key, item):
+        """ Evict other keys until item fits under key in both limits
+
+        Returns:
+            The weight of item, or None if item alone is over max_weight
+            or the cache holds no items, in which case any older item
+            under key is evicted as well.
+        """
+        if self.MAX_ITEMS < 1:
+            if key in self.cache_data:
+                self._evict(key)
+            return None
+        size = 0
+        if self.max_weight is not None:
+            size = self.sizer(item)
+            if size > self.max_weight:
+                if key in self.cache_data:
+                    self._evict(key)
+                return None
+        freed = self.weights.get(key, 0)
+        while (key not in self.cache_data
+               and len(self.cache_data) >= self.MAX_ITEMS
+               or self.max_weight is not None
+               and self.weight - freed + size > self.max_weight):
+            victim = next(
+                (other for other in self._eviction_order() if other != key),
+                None)
+            if victim is None:
+                break
+            self._evict(victim)
+        return size
+
+    def _track(self, key, size, ttl=None):
+        """ Record the weight and deadline of the item just stored under key
+        """
+        self.puts += 1
+        if self.max_weight is not None:
+            self.weight += size - self.weights.get(key, 0)
+            self.weights[key] = size
+        if ttl is None:
+            ttl = self.ttl
+        if ttl is not None:
+            self.deadlines[key] = self.clock() + ttl
+            self.timers.schedule(key, self.deadlines[key])
+        elif self.deadlines.pop(key, None) is not None:
+            self.timers.cancel(key)
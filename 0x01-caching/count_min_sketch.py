@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+""" CountMinSketch module
+"""
+
+MULTIPLIER = 0x9E3779B97F4A7C15
+MASK = (1 << 64) - 1
+SEEDS = (0x8F1BBCDC, 0xCA62C1D6, 0x5A827999, 0x6ED9EBA1)
+MAX_COUNT = 15
+MIN_WIDTH = 16
+MAX_WIDTH = 1 << 20
+HALVE = bytes(count >> 1 for count in range(256))
+
+
+class CountMinSketch():
+    """ Approximate access counts for an unbounded set of keys
+
+    Each key bumps one 4-bit saturating counter per row, and its count
+    is estimated as the smallest of them, which can only overestimate.
+    Every sample_size increments all counters are halved, so old
+    popularity fades and the sketch follows a changing workload.
+
+    A row has a counter per expected key, rounded up to a power of two
+    within MIN_WIDTH and MAX_WIDTH, and aging follows the row width, so
+    small caches forget as quickly as large ones.
+    """
+
+    def __init__(self, capacity, sample_size=None):
+        """ Initialize
+
+        Args:
+            capacity (int): The number of keys expected to matter.
+            sample_size (int): Increments between agings; ten times
+                the row width if None.
+        """
+        width = 1 << (max(capacity, 1) - 1).bit_length()
+        self.width = min(max(width, MIN_WIDTH), MAX_WIDTH)
+        self.shift = 64 - (self.width.bit_length() - 1)
+        self.counters = bytearray(self.width * len(SEEDS))
+        self.sample_size = sample_size or 10 * self.width
+        self.additions = 0
+
+    def __positions(self, key):
+        """ Yield the counter of key in each row
+        """
+        code = hash(key)
+        for row, seed in enumerate(SEEDS):
+            index = ((code ^ seed) * MULTIPLIER & MASK) >> self.shift
+            yield row * self.width + index
+
+    def increment(self, key):
+        """ Count one access to key
+        """
+        for position in self.__positions(key):
+            if self.counters[position] < MAX_COUNT:
+                self.counters[position] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.counters = self.counters.translate(HALVE)
+            self.additions //= 2
+
+    def estimate(self, key):
+        """ Return the estimated access count of key
+        """
+        return min(self.counters[position]
+                   for position in self.__positions(key))
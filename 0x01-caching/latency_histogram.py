@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+""" LatencyHistogram module
+"""
+
+
+class LatencyHistogram():
+    """ Histogram of call latencies in power-of-two nanosecond buckets
+
+    Bucket b counts the latencies from 2 ** (b - 1) up to 2 ** b - 1
+    nanoseconds, so recording is O(1) and a million samples take no
+    more room than a few.
+    """
+
+    def __init__(self):
+        """ Initialize
+        """
+        self.buckets = {}
+        self.count = 0
+
+    def record(self, nanoseconds):
+        """ Count one latency
+        """
+        bucket = int(nanoseconds).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+
+    def merge(self, other):
+        """ Add the latencies recorded by another histogram
+        """
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+
+    def percentile(self, fraction):
+        """ Return the upper bound, in ns, of the bucket holding fraction
+        of the recorded latencies, or None if nothing was recorded
+        """
+        if not self.count:
+            return None
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= fraction * self.count:
+                return 2 ** bucket
+        return 2 ** max(self.buckets)
+
+    def summary(self):
+        """ Return the sample count and the p50, p90 and p99 bounds in ns
+        """
+        return {
+            'samples': self.count,
+            'p50_ns': self.percentile(0.50),
+            'p90_ns': self.percentile(0.90),
+            'p99_ns': self.percentile(0.99),
+        }
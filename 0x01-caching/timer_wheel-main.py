@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+""" timer_wheel-main """
+import time
+
+LRUCache = __import__('3-lru_cache').LRUCache
+TimerWheel = __import__('timer_wheel').TimerWheel
+print_discard = __import__('base_caching').print_discard
+
+now = [0.0]
+my_cache = LRUCache(ttl=10, clock=lambda: now[0])
+my_cache.add_listener(print_discard)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World", ttl=2)
+my_cache.put("C", "Holberton", ttl=30)
+my_cache.print_cache()
+
+now[0] = 2.5
+print(my_cache.get("B"))
+print(my_cache.get("A"))
+
+# Putting a key again restarts its time to live
+now[0] = 9
+my_cache.put("A", "Hello again")
+now[0] = 12
+my_cache.expire()
+my_cache.print_cache()
+now[0] = 19.5
+print(my_cache.get("A"))
+my_cache.put("D", "School", ttl=1)
+now[0] = 21
+my_cache.expire()
+my_cache.print_cache()
+print(my_cache.stats()['expirations'])
+
+# Expired keys are not evicted to make room
+my_cache.put("E", "Battery", ttl=1)
+my_cache.put("F", "Mission")
+my_cache.put("G", "San Francisco")
+now[0] = 22
+my_cache.put("H", "H")
+my_cache.print_cache()
+
+# Deadlines on every level, and past the last one, come due in order
+wheel = TimerWheel()
+for key, deadline in (("soon", 3), ("hour", 3600), ("day", 86400),
+                      ("year", 365 * 86400)):
+    wheel.schedule(key, deadline)
+print(wheel.advance(2), wheel.advance(3), len(wheel))
+print(wheel.advance(86400), len(wheel))
+
+# Advancing over a long idle stretch skips the empty ticks
+start = time.perf_counter()
+print(wheel.advance(365 * 86400), len(wheel))
+print(time.perf_counter() - start < 1)
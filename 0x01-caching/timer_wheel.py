@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+""" TimerWheel module
+"""
+import math
+
+
+class TimerWheel():
+    """ Hierarchical timer wheel tracking when keys expire
+
+    Level 0 has one slot per tick of resolution seconds, and each
+    higher level has one slot per full turn of the level below. A key
+    is filed in the lowest level whose span covers its deadline and
+    moves down a level each time the level above reaches its slot, so
+    scheduling, cancelling and expiring a key are O(1) amortized and
+    nothing ever scans every key.
+    """
+
+    def __init__(self, resolution=1.0, slots=64, levels=4, now=0.0):
+        """ Initialize
+
+        Args:
+            resolution (float): Seconds per tick; keys expire at most one
+                tick late.
+            slots (int): Slots per level.
+            levels (int): Levels; keys due past slots ** levels ticks
+                wait in an overflow slot.
+            now (float): The current time, in the caller's clock.
+        """
+        self.resolution = resolution
+        self.slots = slots
+        self.tick = math.floor(now / resolution)
+        self.wheels = [[{} for _ in range(slots)] for _ in range(levels)]
+        self.overflow = {}
+        self.where = {}
+
+    def __len__(self):
+        """ Return the number of scheduled keys
+        """
+        return len(self.where)
+
+    def __place(self, key, due):
+        """ File key, due at tick due, in the slot covering it
+        """
+        delta = due - self.tick
+        width = 1
+        for wheel in self.wheels:
+            if delta < width * self.slots:
+                slot = wheel[due // width % self.slots]
+                break
+            width *= self.slots
+        else:
+            slot = self.overflow
+        slot[key] = due
+        self.where[key] = slot
+
+    def __next_event(self):
+        """ Return the next tick at which a key expires or moves down
+
+        Ticks with nothing to do are skipped, so advancing over a long
+        idle stretch costs a scan of the slots, not a step per tick.
+        """
+        if self.wheels[0][(self.tick + 1) % self.slots]:
+            return self.tick + 1
+        best = math.inf
+        width = 1
+        for wheel in self.wheels:
+            base = self.tick // width + 1
+            for index, slot in enumerate(wheel):
+                if slot:
+                    turn = base + (index - base) % self.slots
+                    best = min(best, turn * width)
+            width *= self.slots
+        if self.overflow:
+            best = min(best, (self.tick // width + 1) * width)
+        return best
+
+    def schedule(self, key, deadline):
+        """ Expire key at deadline, replacing any earlier schedule
+        """
+        self.cancel(key)
+        due = max(math.ceil(deadline / self.resolution), self.tick + 1)
+        self.__place(key, due)
+
+    def cancel(self, key):
+        """ Forget key's schedule, if it has one
+        """
+        slot = self.where.pop(key, None)
+        if slot is not None:
+            del slot[key]
+
+    def advance(self, now):
+        """ Move the wheel to now and return the keys that came due
+
+        Returns:
+            list: The expired keys, which are no longer scheduled.
+        """
+        target = math.floor(now / self.resolution)
+        expired = []
+        if not self.where:
+            self.tick = max(self.tick, target)
+            return expired
+        while self.tick < target:
+            self.tick = min(self.__next_event(), target)
+            span = 1
+            for level in range(1, len(self.wheels) + 1):
+                span *= self.slots
+                if self.tick % span:
+                    break
+                if level == len(self.wheels):
+                    slot = self.overflow
+                else:
+                    slot = self.wheels[level][self.tick // span % self.slots]
+                for key, due in list(slot.items()):
+                    del slot[key]
+                    if due <= self.tick:
+                        del self.where[key]
+                        expired.append(key)
+                    else:
+                        self.__place(key, due)
+            slot = self.wheels[0][self.tick % self.slots]
+            for key in slot:
+                del self.where[key]
+            expired.extend(slot)
+            slot.clear()
+            if not self.where:
+                self.tick = target
+        return expired